@@ -15,15 +15,20 @@ This module provides comprehensive safety monitoring visualization including:
 - Session safety analytics and trend visualization
 """
 
+import sys
 import time
 import math
-from typing import Dict, Any, List, Optional, Tuple
+import bisect
+from collections import deque
+from itertools import islice
+from typing import Dict, Any, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union, TYPE_CHECKING
 from datetime import datetime, timedelta
+from enum import IntEnum
+from functools import lru_cache
+from time import monotonic as _monotonic
 
-from ..themes.consciousness_colors import ConsciousnessColorScheme
-from ..themes.sacred_geometry import SacredGeometrySymbols, ConsciousnessVisualization
-from ..themes.biofield_aesthetics import BiofieldAesthetics
-from ...src.interfaces.cli_interface import TerminalConsciousnessAdapter
+if TYPE_CHECKING:
+    from ...src.interfaces.cli_interface import TerminalConsciousnessAdapter
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # SAFETY MONITORING CONSTANTS
@@ -45,6 +50,23 @@ COMFORT_LEVEL_THRESHOLDS = {
     'very_uncomfortable': {'range': (0.0, 0.2), 'color': 'status_danger', 'symbol': '😰', 'description': 'Very Uncomfortable'}
 }
 
+# Parallel per-bucket tables derived from the threshold definitions above, indexed by
+# an integer bucket id (neural load: safe→critical, comfort: very uncomfortable→very comfortable)
+_N_NAMES = ('safe', 'caution', 'warning', 'critical')
+_N_BOUNDS = tuple(NEURAL_LOAD_THRESHOLDS[name]['range'][1] for name in _N_NAMES[:-1])
+_N_COLORS = tuple(NEURAL_LOAD_THRESHOLDS[name]['color'] for name in _N_NAMES)
+_N_SYMBOLS = tuple(NEURAL_LOAD_THRESHOLDS[name]['symbol'] for name in _N_NAMES)
+_N_DESCS = tuple(NEURAL_LOAD_THRESHOLDS[name]['description'] for name in _N_NAMES)
+
+_C_NAMES = ('very_uncomfortable', 'uncomfortable', 'neutral', 'comfortable', 'very_comfortable')
+_C_BOUNDS = tuple(COMFORT_LEVEL_THRESHOLDS[name]['range'][0] for name in _C_NAMES[1:])
+_C_COLORS = tuple(COMFORT_LEVEL_THRESHOLDS[name]['color'] for name in _C_NAMES)
+_C_SYMBOLS = tuple(COMFORT_LEVEL_THRESHOLDS[name]['symbol'] for name in _C_NAMES)
+_C_DESCS = tuple(COMFORT_LEVEL_THRESHOLDS[name]['description'] for name in _C_NAMES)
+
+# Overall safety status by severity (0 = safe ... 3 = critical)
+_OVERALL_NAMES = ('safe', 'caution', 'warning', 'critical')
+
 # Safety protocol status
 SAFETY_PROTOCOL_STATUS = {
     'active': {'color': 'status_active', 'symbol': '●', 'description': 'Active'},
@@ -57,6 +79,149 @@ SAFETY_PROTOCOL_STATUS = {
 NEURAL_LOAD_HISTORY_MINUTES = 5
 COMFORT_CHECK_INTERVALS = [300, 600, 900]  # 5, 10, 15 minutes
 SAFETY_ALERT_COOLDOWN = 30  # seconds
+MAX_ACTIVE_ALERTS = 5
+ALERT_HISTORY_LIMIT = 1024  # recent alerts kept in memory for inspection
+RECOMMENDATION_CACHE_LIMIT = 256  # distinct recommendation sets shared between alerts
+
+# Animation frame pacing (seconds); the interval backs off when renders run long
+ANIMATION_FRAME_INTERVAL = 0.5
+MAX_ANIMATION_FRAME_INTERVAL = 2.0
+
+# Neural load wave pattern geometry (phase-independent, computed once)
+NEURAL_WAVE_WIDTH = 40
+NEURAL_WAVE_ROWS = 4
+_WAVE_COLUMN_PHASES = tuple(col / NEURAL_WAVE_WIDTH * 4 * math.pi for col in range(NEURAL_WAVE_WIDTH))
+_WAVE_ROW_FACTORS = tuple(math.cos(row * math.pi / 8) for row in range(NEURAL_WAVE_ROWS))
+
+# Alert severity symbols, indexed by AlertSeverity
+_SEVERITY_SYMBOLS = ('ℹ', '⚠', '🚨')
+
+# Trend display symbols (neural load improves as it falls, comfort as it rises)
+_NEURAL_TREND_SYMBOLS = {'improving': '↘', 'stable': '→', 'increasing': '↗'}
+_COMFORT_TREND_SYMBOLS = {'improving': '↗', 'stable': '→', 'declining': '↘'}
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SAFETY ALERT RECORD
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class AlertSeverity(IntEnum):
+    """Safety alert severity levels, ordered by urgency."""
+    INFO = 0
+    WARNING = 1
+    CRITICAL = 2
+
+# Accepted severity names; anything else is treated as a warning
+_SEVERITY_BY_NAME = {
+    'info': AlertSeverity.INFO,
+    'warn': AlertSeverity.WARNING,
+    'warning': AlertSeverity.WARNING,
+    'critical': AlertSeverity.CRITICAL
+}
+
+def _coerce_severity(severity: Any) -> AlertSeverity:
+    """Normalize a severity name or level to an AlertSeverity."""
+    
+    if isinstance(severity, AlertSeverity):
+        return severity
+    return _SEVERITY_BY_NAME.get(str(severity).lower(), AlertSeverity.WARNING)
+
+class SafetyAlert(NamedTuple):
+    """Compact, immutable safety alert record."""
+    type: str
+    severity: AlertSeverity
+    message: str
+    timestamp: float
+    recommendations: Tuple[str, ...] = ()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style field access, so alert dicts and records render the same way."""
+        # Only record fields count as keys; tuple methods like count/index do not
+        return getattr(self, key) if key in self._fields else default
+
+# Canned recommendation sets repeat across alerts; share one interned tuple per set
+_RECOMMENDATION_CACHE: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+def _intern_recommendations(recommendations: Optional[Sequence[str]]) -> Tuple[str, ...]:
+    """Return a shared, immutable tuple of interned recommendation strings."""
+    
+    if not recommendations:
+        return ()
+    recs = tuple(sys.intern(rec) for rec in recommendations)
+    if len(_RECOMMENDATION_CACHE) >= RECOMMENDATION_CACHE_LIMIT:
+        return _RECOMMENDATION_CACHE.get(recs, recs)
+    return _RECOMMENDATION_CACHE.setdefault(recs, recs)
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# FORMATTING HELPERS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _format_seconds(total: int) -> str:
+    return f"{total}s"
+
+def _format_minutes(total: int) -> str:
+    minutes, secs = divmod(total, 60)
+    return f"{minutes}m {secs}s" if secs else f"{minutes}m"
+
+def _format_hours(total: int) -> str:
+    hours, remainder = divmod(total, 3600)
+    return f"{hours}h {remainder // 60}m"
+
+# Duration unit boundaries (seconds) and the formatter for each resulting range
+_DURATION_BOUNDS = (60, 3600)
+_DURATION_FORMATTERS = (_format_seconds, _format_minutes, _format_hours)
+
+@lru_cache(maxsize=4096)
+def _format_duration_int(total: int) -> str:
+    """Format a whole number of seconds; cached since the HUD redraws the same second repeatedly."""
+    return _DURATION_FORMATTERS[bisect.bisect_right(_DURATION_BOUNDS, total)](total)
+
+def _format_duration(seconds: float) -> str:
+    """Format duration in human-readable format."""
+    return _format_duration_int(int(seconds))
+
+def _format_alert_time(timestamp) -> str:
+    """Format an alert timestamp (epoch seconds or datetime) as wall-clock time."""
+    
+    if not isinstance(timestamp, datetime):
+        timestamp = datetime.fromtimestamp(timestamp)
+    return timestamp.strftime('%H:%M:%S')
+
+def _neural_load_bucket(neural_load: float) -> int:
+    """Neural load bucket id; boundary values belong to the lower bucket."""
+    return bisect.bisect_left(_N_BOUNDS, neural_load)
+
+def _comfort_level_bucket(comfort_level: float) -> int:
+    """Comfort level bucket id; boundary values belong to the upper bucket."""
+    return bisect.bisect_right(_C_BOUNDS, comfort_level)
+
+def _compute_wave_grid(neural_load: float, t: float) -> List[str]:
+    """Compute the uncolored rows of the neural load wave pattern."""
+    
+    sin = math.sin
+    
+    # Higher neural load = more intense/frequent waves
+    freq_factor = 1.0 + neural_load * 3.0
+    amplitude_factor = 0.5 + neural_load * 0.5
+    
+    # Rows only differ by a constant attenuation, so each column's wave is evaluated once
+    wave = [abs(sin(x * freq_factor + t) * amplitude_factor) for x in _WAVE_COLUMN_PHASES]
+    
+    rows = []
+    for row_factor in _WAVE_ROW_FACTORS:
+        chars = []
+        for magnitude in wave:
+            value = magnitude * row_factor
+            if value > 0.6:
+                chars.append('█')
+            elif value > 0.3:
+                chars.append('▓')
+            elif value > 0.1:
+                chars.append('▒')
+            else:
+                chars.append('░')
+        rows.append(''.join(chars))
+    
+    return rows
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # SAFETY MONITOR CLASS
@@ -71,7 +236,28 @@ class SafetyMonitor:
     neural architecture compatibility monitoring in a beautiful terminal interface.
     """
     
-    def __init__(self, terminal_adapter: TerminalConsciousnessAdapter):
+    # Samples kept in the neural load / comfort level histories
+    MAX_HISTORY = 10
+    
+    __slots__ = (
+        'terminal_adapter', 'color_scheme', 'symbols', 'consciousness_viz', 'biofield',
+        'current_neural_load', 'current_comfort_level',
+        'neural_load_history', 'comfort_level_history',
+        'last_comfort_check', 'last_alert_time', 'safety_protocols',
+        'active_alerts', 'alert_history', '_active_alerts_append', '_alert_history_append',
+        'animation_frame', 'last_update', 'frame_interval', '_frame_budget', '_last_render_cost',
+        '_neural_trend_colors', '_comfort_trend_colors', '_severity_colors',
+        '_neural_thresholds_footer'
+    )
+    
+    def __init__(self,
+                 terminal_adapter: 'TerminalConsciousnessAdapter',
+                 frame_interval: float = ANIMATION_FRAME_INTERVAL):
+        # Theme modules are only needed to build these helpers, so import them on first use
+        from ..themes.consciousness_colors import ConsciousnessColorScheme
+        from ..themes.sacred_geometry import SacredGeometrySymbols, ConsciousnessVisualization
+        from ..themes.biofield_aesthetics import BiofieldAesthetics
+        
         self.terminal_adapter = terminal_adapter
         self.color_scheme = ConsciousnessColorScheme()
         self.symbols = SacredGeometrySymbols()
@@ -81,8 +267,9 @@ class SafetyMonitor:
         # Safety monitoring state
         self.current_neural_load = 0.0
         self.current_comfort_level = 0.8
-        self.neural_load_history = []
-        self.comfort_level_history = []
+        # Bounded to the last 5 minutes of data, assuming 30-second intervals
+        self.neural_load_history = deque(maxlen=self.MAX_HISTORY)
+        self.comfort_level_history = deque(maxlen=self.MAX_HISTORY)
         self.last_comfort_check = datetime.now()
         self.last_alert_time = {}
         
@@ -96,12 +283,33 @@ class SafetyMonitor:
         }
         
         # Alert state
-        self.active_alerts = []
-        self.alert_history = []
+        self.active_alerts = deque(maxlen=MAX_ACTIVE_ALERTS)
+        self.alert_history = deque(maxlen=ALERT_HISTORY_LIMIT)
+        # Bound appends for add_safety_alert (clear() keeps the same deque, so these stay valid)
+        self._active_alerts_append = self.active_alerts.append
+        self._alert_history_append = self.alert_history.append
         
         # Animation state
         self.animation_frame = 0
-        self.last_update = time.time()
+        self.last_update = _monotonic()
+        self.frame_interval = frame_interval
+        self._frame_budget = frame_interval
+        self._last_render_cost = 0.0
+        
+        # Trend and severity colors resolved once rather than per render
+        colors = self.color_scheme
+        self._neural_trend_colors = {
+            'improving': colors.status_safe,
+            'stable': colors.gentle_text,
+            'increasing': colors.status_caution
+        }
+        self._comfort_trend_colors = {
+            'improving': colors.status_safe,
+            'stable': colors.gentle_text,
+            'declining': colors.status_caution
+        }
+        self._severity_colors = (colors.gentle_text, colors.status_caution, colors.status_danger)
+        self._neural_thresholds_footer = None
     
     def show_safety_status(self, 
                           neural_load: float,
@@ -115,8 +323,8 @@ class SafetyMonitor:
             comfort_level: Current comfort level (0.0-1.0)
             session_duration: Current session duration in seconds
         """
+        render_start = _monotonic()
         colors = self.color_scheme
-        symbols = self.symbols
         
         # Update current values
         self.current_neural_load = neural_load
@@ -129,17 +337,18 @@ class SafetyMonitor:
         print(f"{colors.consciousness_header('🛡️' * 60)}")
         
         # Overall safety status
-        overall_status = self._calculate_overall_safety_status(neural_load, comfort_level)
+        neural_bucket, comfort_bucket, overall_status = self._resolve_buckets(neural_load, comfort_level)
         status_info = self._get_safety_status_info(overall_status)
         
+        status_label = f"{status_info['symbol']} {status_info['description']}"
         print(f"\n{colors.safety_accent('Overall Safety Status:')} "
-              f"{getattr(colors, status_info['color'])(f\"{status_info['symbol']} {status_info['description']}\")}")
+              f"{getattr(colors, status_info['color'])(status_label)}")
         
         # Neural load monitoring
-        self._display_neural_load_status(neural_load)
+        self._display_neural_load_status(neural_load, neural_bucket)
         
         # Comfort level monitoring
-        self._display_comfort_level_status(comfort_level, session_duration)
+        self._display_comfort_level_status(comfort_level, session_duration, comfort_bucket)
         
         # Safety protocols status
         self._display_safety_protocols_status()
@@ -151,6 +360,8 @@ class SafetyMonitor:
         # Safety trends
         if len(self.neural_load_history) > 5:
             self._display_safety_trends()
+        
+        self._record_render_cost(_monotonic() - render_start)
     
     def show_neural_load_monitor(self, 
                                 neural_load: float,
@@ -164,24 +375,22 @@ class SafetyMonitor:
             neural_profile: User's neural profile for contextualization
             show_history: Whether to show neural load history
         """
+        render_start = _monotonic()
         colors = self.color_scheme
-        symbols = self.symbols
         
         print(f"\n{colors.consciousness_header('🧠' * 50)}")
         print(f"{colors.consciousness_title('🧠 Neural Load Monitor')}")
         print(f"{colors.consciousness_header('🧠' * 50)}")
         
         # Neural load display
-        load_threshold = self._get_neural_load_threshold(neural_load)
-        threshold_info = NEURAL_LOAD_THRESHOLDS[load_threshold]
+        load_bucket = _neural_load_bucket(neural_load)
         
         # Create neural load visualization
         load_bar = colors.create_progress_bar(neural_load, 30)
         load_percentage = f"{neural_load:.1%}"
         
         print(f"\n{colors.biofield_accent('Current Neural Load:')} {load_bar} {load_percentage}")
-        print(f"{colors.biofield_accent('Status:')} "
-              f"{getattr(colors, threshold_info['color'])(f\"{threshold_info['symbol']} {threshold_info['description']}\")}")
+        print(f"{colors.biofield_accent('Status:')} {self._neural_status_display(load_bucket)}")
         
         # Neural profile contextualization
         if neural_profile:
@@ -209,6 +418,8 @@ class SafetyMonitor:
         # History display
         if show_history and len(self.neural_load_history) > 3:
             self._display_neural_load_history()
+        
+        self._record_render_cost(_monotonic() - render_start)
     
     def show_comfort_assessment(self, 
                               comfort_level: float,
@@ -220,10 +431,9 @@ class SafetyMonitor:
         Args:
             comfort_level: Current comfort level (0.0-1.0)
             session_time: Current session time in seconds
-            check_intervals: List of comfort check intervals
+            check_intervals: Ascending list of comfort check intervals
         """
         colors = self.color_scheme
-        symbols = self.symbols
         
         if check_intervals is None:
             check_intervals = COMFORT_CHECK_INTERVALS
@@ -233,37 +443,34 @@ class SafetyMonitor:
         print(f"{colors.consciousness_header('💚' * 50)}")
         
         # Comfort level display
-        comfort_threshold = self._get_comfort_level_threshold(comfort_level)
-        threshold_info = COMFORT_LEVEL_THRESHOLDS[comfort_threshold]
+        comfort_bucket = _comfort_level_bucket(comfort_level)
         
         comfort_bar = colors.create_progress_bar(comfort_level, 30)
         comfort_percentage = f"{comfort_level:.1%}"
         
         print(f"\n{colors.biofield_accent('Current Comfort:')} {comfort_bar} {comfort_percentage}")
-        print(f"{colors.biofield_accent('Assessment:')} "
-              f"{getattr(colors, threshold_info['color'])(f\"{threshold_info['symbol']} {threshold_info['description']}\")}")
+        print(f"{colors.biofield_accent('Assessment:')} {self._comfort_status_display(comfort_bucket)}")
         
         # Session time and check schedule
         print(f"\n{colors.gentle_text('Session Progress:')}")
-        print(f"  Current Time: {colors.gentle_text(self._format_duration(session_time))}")
+        print(f"  Current Time: {colors.gentle_text(_format_duration(session_time))}")
         
         # Show upcoming comfort checks
         next_check = None
-        for interval in check_intervals:
-            if session_time < interval:
-                next_check = interval - session_time
-                break
+        idx = bisect.bisect_right(check_intervals, session_time)
+        if idx < len(check_intervals):
+            next_check = check_intervals[idx] - session_time
         
         if next_check:
-            print(f"  Next Check: {colors.gentle_text(self._format_duration(next_check))}")
+            print(f"  Next Check: {colors.gentle_text(_format_duration(next_check))}")
         else:
             print(f"  {colors.status_safe('All scheduled checks complete')}")
         
         # Comfort trend
         if len(self.comfort_level_history) > 3:
             trend = self._calculate_comfort_trend()
-            trend_symbol = {'improving': '↗', 'stable': '→', 'declining': '↘'}.get(trend, '→')
-            trend_color = {'improving': colors.status_safe, 'stable': colors.gentle_text, 'declining': colors.status_caution}.get(trend, colors.gentle_text)
+            trend_symbol = _COMFORT_TREND_SYMBOLS[trend]
+            trend_color = self._comfort_trend_colors[trend]
             
             print(f"  Trend: {trend_color(f'{trend_symbol} {trend.title()}')}")
         
@@ -274,18 +481,22 @@ class SafetyMonitor:
             for rec in recommendations:
                 print(f"  • {colors.gentle_text(rec)}")
     
-    def show_safety_alerts(self, alerts: List[Dict[str, Any]] = None) -> None:
+    def show_safety_alerts(self, alerts: Optional[Iterable[Union[SafetyAlert, Dict[str, Any]]]] = None) -> None:
         """
         Display active safety alerts and warnings.
         
         Args:
-            alerts: List of active alert dictionaries
+            alerts: List of active alerts as SafetyAlert records or dictionaries
+                    (the most recent MAX_ACTIVE_ALERTS are kept)
         """
         colors = self.color_scheme
-        symbols = self.symbols
         
         if alerts is not None:
-            self.active_alerts = alerts
+            # Copy before clearing: callers may pass active_alerts itself. The deque is
+            # refilled rather than rebound because _active_alerts_append is bound to it
+            incoming = list(alerts)
+            self.active_alerts.clear()
+            self.active_alerts.extend(incoming)
         
         if not self.active_alerts:
             print(f"\n{colors.status_safe('✓ No active safety alerts')}")
@@ -297,29 +508,18 @@ class SafetyMonitor:
         
         for i, alert in enumerate(self.active_alerts, 1):
             alert_type = alert.get('type', 'general')
-            severity = alert.get('severity', 'warning')
+            severity = _coerce_severity(alert.get('severity', AlertSeverity.WARNING))
             message = alert.get('message', 'Safety alert')
-            timestamp = alert.get('timestamp', datetime.now())
+            timestamp = alert.get('timestamp') or time.time()
             recommendations = alert.get('recommendations', [])
             
             # Alert header
-            severity_colors = {
-                'info': colors.gentle_text,
-                'warning': colors.status_caution,
-                'critical': colors.status_danger
-            }
-            severity_symbols = {
-                'info': 'ℹ',
-                'warning': '⚠',
-                'critical': '🚨'
-            }
-            
-            severity_color = severity_colors.get(severity, colors.status_caution)
-            severity_symbol = severity_symbols.get(severity, '⚠')
+            severity_color = self._severity_colors[severity]
+            severity_symbol = _SEVERITY_SYMBOLS[severity]
             
             print(f"\n{severity_color(f'{severity_symbol} Alert {i}:')} {severity_color(message)}")
             print(f"  {colors.gentle_text('Type:')} {colors.gentle_text(alert_type.title())}")
-            print(f"  {colors.gentle_text('Time:')} {colors.gentle_text(timestamp.strftime('%H:%M:%S'))}")
+            print(f"  {colors.gentle_text('Time:')} {colors.gentle_text(_format_alert_time(timestamp))}")
             
             # Recommendations
             if recommendations:
@@ -331,7 +531,6 @@ class SafetyMonitor:
         """Display emergency control interface."""
         
         colors = self.color_scheme
-        symbols = self.symbols
         
         print(f"\n{colors.consciousness_header('🚨' * 50)}")
         print(f"{colors.consciousness_title('🚨 Emergency Controls')}")
@@ -341,8 +540,9 @@ class SafetyMonitor:
         emergency_status = self.safety_protocols.get('emergency_stop', 'active')
         status_info = SAFETY_PROTOCOL_STATUS[emergency_status]
         
+        status_label = f"{status_info['symbol']} {status_info['description']}"
         print(f"\n{colors.status_danger('Emergency Stop:')} "
-              f"{getattr(colors, status_info['color'])(f\"{status_info['symbol']} {status_info['description']}\")}")
+              f"{getattr(colors, status_info['color'])(status_label)}")
         
         # Emergency controls
         print(f"\n{colors.consciousness_accent('Available Emergency Actions:')}")
@@ -356,13 +556,13 @@ class SafetyMonitor:
         print(f"  • {colors.gentle_text('Consult healthcare provider if symptoms persist')}")
         print(f"  • {colors.gentle_text('Report serious issues to system administrator')}")
     
-    def _display_neural_load_status(self, neural_load: float) -> None:
+    def _display_neural_load_status(self, neural_load: float, load_bucket: Optional[int] = None) -> None:
         """Display neural load status section."""
         
         colors = self.color_scheme
         
-        load_threshold = self._get_neural_load_threshold(neural_load)
-        threshold_info = NEURAL_LOAD_THRESHOLDS[load_threshold]
+        if load_bucket is None:
+            load_bucket = _neural_load_bucket(neural_load)
         
         print(f"\n{colors.biofield_accent('Neural Load Monitoring:')}")
         
@@ -371,35 +571,40 @@ class SafetyMonitor:
         print(f"  Current Load: {load_bar}")
         
         # Status and description
-        status_display = getattr(colors, threshold_info['color'])(f"{threshold_info['symbol']} {threshold_info['description']}")
-        print(f"  Status: {status_display}")
-        
-        # Threshold information
-        print(f"  {colors.gentle_text('Thresholds:')} "
-              f"{colors.status_safe('Safe: 0-60%')} | "
-              f"{colors.status_caution('Caution: 60-80%')} | "
-              f"{colors.status_warning('Warning: 80-90%')} | "
-              f"{colors.status_danger('Critical: 90%+')}")
+        print(f"  Status: {self._neural_status_display(load_bucket)}")
+        
+        # Threshold information (static, so formatted once on first render)
+        if self._neural_thresholds_footer is None:
+            self._neural_thresholds_footer = (
+                f"{colors.gentle_text('Thresholds:')} "
+                f"{colors.status_safe('Safe: 0-60%')} | "
+                f"{colors.status_caution('Caution: 60-80%')} | "
+                f"{colors.status_warning('Warning: 80-90%')} | "
+                f"{colors.status_danger('Critical: 90%+')}"
+            )
+        print(f"  {self._neural_thresholds_footer}")
     
-    def _display_comfort_level_status(self, comfort_level: float, session_duration: float) -> None:
+    def _display_comfort_level_status(self,
+                                      comfort_level: float,
+                                      session_duration: float,
+                                      comfort_bucket: Optional[int] = None) -> None:
         """Display comfort level status section."""
         
         colors = self.color_scheme
         
-        comfort_threshold = self._get_comfort_level_threshold(comfort_level)
-        threshold_info = COMFORT_LEVEL_THRESHOLDS[comfort_threshold]
+        if comfort_bucket is None:
+            comfort_bucket = _comfort_level_bucket(comfort_level)
         
         print(f"\n{colors.biofield_accent('Comfort Level Monitoring:')}")
         
         comfort_bar = colors.create_progress_bar(comfort_level, 30)
         print(f"  Current Comfort: {comfort_bar} {comfort_level:.1%}")
         
-        status_display = getattr(colors, threshold_info['color'])(f"{threshold_info['symbol']} {threshold_info['description']}")
-        print(f"  Assessment: {status_display}")
+        print(f"  Assessment: {self._comfort_status_display(comfort_bucket)}")
         
         # Time since last check
         time_since_check = (datetime.now() - self.last_comfort_check).total_seconds()
-        print(f"  Last Check: {colors.gentle_text(self._format_duration(time_since_check))} ago")
+        print(f"  Last Check: {colors.gentle_text(_format_duration(time_since_check))} ago")
     
     def _display_safety_protocols_status(self) -> None:
         """Display safety protocols status."""
@@ -422,11 +627,11 @@ class SafetyMonitor:
         
         print(f"\n{colors.status_caution('Active Alerts:')}")
         
-        for alert in self.active_alerts[:3]:  # Show max 3 most recent
-            severity = alert.get('severity', 'warning')
+        for alert in islice(self.active_alerts, 3):  # Show max 3 most recent
+            severity = _coerce_severity(alert.get('severity', AlertSeverity.WARNING))
             message = alert.get('message', 'Safety alert')
             
-            if severity == 'critical':
+            if severity is AlertSeverity.CRITICAL:
                 print(f"  🚨 {colors.status_danger(message)}")
             else:
                 print(f"  ⚠ {colors.status_caution(message)}")
@@ -440,18 +645,15 @@ class SafetyMonitor:
         
         # Neural load trend
         neural_trend = self._calculate_neural_load_trend()
-        trend_symbols = {'improving': '↘', 'stable': '→', 'increasing': '↗'}
-        trend_colors = {'improving': colors.status_safe, 'stable': colors.gentle_text, 'increasing': colors.status_caution}
-        
-        neural_symbol = trend_symbols.get(neural_trend, '→')
-        neural_color = trend_colors.get(neural_trend, colors.gentle_text)
+        neural_symbol = _NEURAL_TREND_SYMBOLS[neural_trend]
+        neural_color = self._neural_trend_colors[neural_trend]
         
         print(f"  Neural Load: {neural_color(f'{neural_symbol} {neural_trend.title()}')}")
         
         # Comfort trend
         comfort_trend = self._calculate_comfort_trend()
-        comfort_symbol = trend_symbols.get(comfort_trend, '→')
-        comfort_color = trend_colors.get(comfort_trend, colors.gentle_text)
+        comfort_symbol = _COMFORT_TREND_SYMBOLS[comfort_trend]
+        comfort_color = self._comfort_trend_colors[comfort_trend]
         
         print(f"  Comfort: {comfort_color(f'{comfort_symbol} {comfort_trend.title()}')}")
     
@@ -467,26 +669,29 @@ class SafetyMonitor:
         for line in history_viz:
             print(f"  {line}")
     
-    def _calculate_overall_safety_status(self, neural_load: float, comfort_level: float) -> str:
-        """Calculate overall safety status."""
-        
-        neural_threshold = self._get_neural_load_threshold(neural_load)
-        comfort_threshold = self._get_comfort_level_threshold(comfort_level)
-        
-        # Critical conditions
-        if neural_threshold == 'critical' or comfort_threshold == 'very_uncomfortable':
-            return 'critical'
+    def _resolve_buckets(self, neural_load: float, comfort_level: float) -> Tuple[int, int, str]:
+        """Resolve neural load, comfort and overall safety buckets in one pass."""
         
-        # Warning conditions
-        if neural_threshold == 'warning' or comfort_threshold == 'uncomfortable':
-            return 'warning'
+        neural_bucket = _neural_load_bucket(neural_load)
+        comfort_bucket = _comfort_level_bucket(comfort_level)
         
-        # Caution conditions
-        if neural_threshold == 'caution' or comfort_threshold == 'neutral':
-            return 'caution'
+        # Overall status is the worse of the two: neural load severity rises with its
+        # bucket id, comfort severity falls (very_uncomfortable=critical ... comfortable=safe)
+        severity = max(neural_bucket, 3 - comfort_bucket, 0)
         
-        # Safe
-        return 'safe'
+        return neural_bucket, comfort_bucket, _OVERALL_NAMES[severity]
+    
+    def _calculate_overall_safety_status(self, neural_load: float, comfort_level: float) -> str:
+        """Calculate overall safety status."""
+        return self._resolve_buckets(neural_load, comfort_level)[2]
+    
+    def _neural_status_display(self, bucket: int) -> str:
+        """Format the colored status label for a neural load bucket."""
+        return getattr(self.color_scheme, _N_COLORS[bucket])(f"{_N_SYMBOLS[bucket]} {_N_DESCS[bucket]}")
+    
+    def _comfort_status_display(self, bucket: int) -> str:
+        """Format the colored assessment label for a comfort level bucket."""
+        return getattr(self.color_scheme, _C_COLORS[bucket])(f"{_C_SYMBOLS[bucket]} {_C_DESCS[bucket]}")
     
     def _get_safety_status_info(self, status: str) -> Dict[str, str]:
         """Get safety status display information."""
@@ -502,21 +707,11 @@ class SafetyMonitor:
     
     def _get_neural_load_threshold(self, neural_load: float) -> str:
         """Determine neural load threshold level."""
-        
-        for threshold, info in NEURAL_LOAD_THRESHOLDS.items():
-            if info['range'][0] <= neural_load <= info['range'][1]:
-                return threshold
-        
-        return 'critical' if neural_load > 0.9 else 'safe'
+        return _N_NAMES[_neural_load_bucket(neural_load)]
     
     def _get_comfort_level_threshold(self, comfort_level: float) -> str:
         """Determine comfort level threshold."""
-        
-        for threshold, info in COMFORT_LEVEL_THRESHOLDS.items():
-            if info['range'][0] <= comfort_level <= info['range'][1]:
-                return threshold
-        
-        return 'very_uncomfortable' if comfort_level < 0.2 else 'very_comfortable'
+        return _C_NAMES[_comfort_level_bucket(comfort_level)]
     
     def _create_neural_load_bar_with_thresholds(self, neural_load: float, width: int) -> str:
         """Create neural load progress bar with threshold markers."""
@@ -549,47 +744,17 @@ class SafetyMonitor:
     def _create_neural_load_visualization(self, neural_load: float) -> List[str]:
         """Create neural load pattern visualization."""
         
-        lines = []
         colors = self.color_scheme
-        width = 40
-        
-        # Create brain wave pattern representing neural load
-        for row in range(4):
-            line = ""
-            for col in range(width):
-                x = col / width * 4 * math.pi
-                t = self.animation_frame * 0.1
-                
-                # Higher neural load = more intense/frequent waves
-                freq_factor = 1.0 + neural_load * 3.0
-                amplitude_factor = 0.5 + neural_load * 0.5
-                
-                wave_value = math.sin(x * freq_factor + t) * amplitude_factor
-                row_offset = row * math.pi / 8
-                final_value = wave_value * math.cos(row_offset)
-                
-                if abs(final_value) > 0.6:
-                    char = '█'
-                elif abs(final_value) > 0.3:
-                    char = '▓'
-                elif abs(final_value) > 0.1:
-                    char = '▒'
-                else:
-                    char = '░'
-                
-                line += char
-            
-            # Color based on neural load level
-            if neural_load < 0.6:
-                colored_line = colors.status_safe(line)
-            elif neural_load < 0.8:
-                colored_line = colors.status_caution(line)
-            else:
-                colored_line = colors.status_danger(line)
-            
-            lines.append(colored_line)
         
-        return lines
+        # Color based on neural load level
+        if neural_load < 0.6:
+            colorize = colors.status_safe
+        elif neural_load < 0.8:
+            colorize = colors.status_caution
+        else:
+            colorize = colors.status_danger
+        
+        return [colorize(line) for line in _compute_wave_grid(neural_load, self.animation_frame * 0.1)]
     
     def _create_neural_load_history_graph(self) -> List[str]:
         """Create ASCII graph of neural load history."""
@@ -601,31 +766,24 @@ class SafetyMonitor:
             return [colors.gentle_text("Not enough history data")]
         
         # Use last 20 data points
-        history = self.neural_load_history[-20:]
+        history = list(self.neural_load_history)[-20:]
         width = min(len(history), 40)
         height = 5
+        history = history[:width]
+        
+        # Each column's colored cell depends only on its value, so color it once
+        filled_cells = (colors.status_safe('▓'), colors.status_caution('▓'), colors.status_danger('▓'))
+        empty_cell = colors.gentle_text('░')
+        column_cells = [filled_cells[0] if value < 0.6 else filled_cells[1] if value < 0.8 else filled_cells[2]
+                        for value in history]
         
         # Create graph
         for row in range(height):
-            line = ""
             threshold = 1.0 - (row / height)  # Top row = 100%, bottom = 0%
+            cutoff = threshold - 0.2  # Show if within range
             
-            for col in range(width):
-                if col < len(history):
-                    value = history[col]
-                    if value >= threshold - 0.2:  # Show if within range
-                        if value < 0.6:
-                            char = colors.status_safe('▓')
-                        elif value < 0.8:
-                            char = colors.status_caution('▓')
-                        else:
-                            char = colors.status_danger('▓')
-                    else:
-                        char = colors.gentle_text('░')
-                else:
-                    char = ' '
-                
-                line += char
+            line = ''.join(cell if value >= cutoff else empty_cell
+                           for value, cell in zip(history, column_cells))
             
             # Add scale
             scale_label = f"{threshold:.0%}"
@@ -643,10 +801,11 @@ class SafetyMonitor:
         if len(self.neural_load_history) < 3:
             return 'stable'
         
-        recent = self.neural_load_history[-3:]
-        if recent[-1] > recent[0] + 0.1:
+        history = self.neural_load_history
+        latest, earlier = history[-1], history[-3]
+        if latest > earlier + 0.1:
             return 'increasing'
-        elif recent[-1] < recent[0] - 0.1:
+        elif latest < earlier - 0.1:
             return 'improving'
         else:
             return 'stable'
@@ -657,10 +816,11 @@ class SafetyMonitor:
         if len(self.comfort_level_history) < 3:
             return 'stable'
         
-        recent = self.comfort_level_history[-3:]
-        if recent[-1] > recent[0] + 0.1:
+        history = self.comfort_level_history
+        latest, earlier = history[-1], history[-3]
+        if latest > earlier + 0.1:
             return 'improving'
-        elif recent[-1] < recent[0] - 0.1:
+        elif latest < earlier - 0.1:
             return 'declining'
         else:
             return 'stable'
@@ -711,60 +871,53 @@ class SafetyMonitor:
     def _update_history(self, neural_load: float, comfort_level: float) -> None:
         """Update monitoring history."""
         
-        current_time = datetime.now()
-        
-        # Add to history
+        # Add to history (bounded deques evict the oldest samples)
         self.neural_load_history.append(neural_load)
         self.comfort_level_history.append(comfort_level)
+    
+    def extend_history(self, neural_loads: Sequence[float], comfort_levels: Sequence[float]) -> None:
+        """Append a batch of samples received between frames in one call."""
         
-        # Limit history size (keep last 5 minutes of data, assuming 30-second intervals)
-        max_history = 10
-        if len(self.neural_load_history) > max_history:
-            self.neural_load_history = self.neural_load_history[-max_history:]
-        if len(self.comfort_level_history) > max_history:
-            self.comfort_level_history = self.comfort_level_history[-max_history:]
+        if len(neural_loads) != len(comfort_levels):
+            raise ValueError("neural_loads and comfort_levels must be the same length")
+        
+        # deque.extend keeps only the newest maxlen samples, like repeated appends
+        self.neural_load_history.extend(neural_loads)
+        self.comfort_level_history.extend(comfort_levels)
     
     def _format_duration(self, seconds: float) -> str:
         """Format duration in human-readable format."""
-        
-        if seconds < 60:
-            return f"{seconds:.0f}s"
-        elif seconds < 3600:
-            minutes = seconds // 60
-            remaining_seconds = seconds % 60
-            if remaining_seconds == 0:
-                return f"{minutes:.0f}m"
-            else:
-                return f"{minutes:.0f}m {remaining_seconds:.0f}s"
-        else:
-            hours = seconds // 3600
-            remaining_minutes = (seconds % 3600) // 60
-            return f"{hours:.0f}h {remaining_minutes:.0f}m"
+        return _format_duration(seconds)
     
     def update_animation_frame(self) -> None:
         """Update animation frame for continuous animations."""
-        current_time = time.time()
-        if current_time - self.last_update > 0.5:  # Update every 500ms
+        current_time = _monotonic()
+        if current_time - self.last_update > self._frame_budget:
             self.animation_frame += 1
             self.last_update = current_time
     
-    def add_safety_alert(self, alert_type: str, severity: str, message: str, recommendations: List[str] = None) -> None:
-        """Add a new safety alert."""
-        
-        alert = {
-            'type': alert_type,
-            'severity': severity,
-            'message': message,
-            'timestamp': datetime.now(),
-            'recommendations': recommendations or []
-        }
+    def _record_render_cost(self, render_cost: float) -> None:
+        """Adapt the animation frame budget to how long the last render took."""
+        
+        self._last_render_cost = render_cost
+        
+        if render_cost > self._frame_budget * 0.5:
+            # Slow render - back off so monitoring keeps its CPU share
+            ceiling = max(MAX_ANIMATION_FRAME_INTERVAL, self.frame_interval)
+            self._frame_budget = min(self._frame_budget * 2.0, ceiling)
+        elif self._frame_budget > self.frame_interval:
+            # Fast render - decay back toward the configured interval
+            self._frame_budget = max(self._frame_budget * 0.8, self.frame_interval)
+    
+    def add_safety_alert(self, alert_type: str, severity: Any, message: str,
+                         recommendations: Optional[Sequence[str]] = None) -> None:
+        """Add a new safety alert (severity may be an AlertSeverity or its name)."""
         
-        self.active_alerts.append(alert)
-        self.alert_history.append(alert)
+        alert = SafetyAlert(sys.intern(alert_type), _coerce_severity(severity), message,
+                            time.time(), _intern_recommendations(recommendations))
         
-        # Limit active alerts
-        if len(self.active_alerts) > 5:
-            self.active_alerts = self.active_alerts[-5:]
+        self._active_alerts_append(alert)
+        self._alert_history_append(alert)
     
     def clear_alerts(self) -> None:
         """Clear active alerts."""
@@ -11,39 +11,53 @@ display optimization, and consciousness-aware visualization across
 different terminal environments and capabilities.
 """
 
-import sys
-import os
-from typing import Dict, Any, List, Optional, Tuple, Union
+import importlib
 
-# Import the main utilities
-from .terminal_detection import (
-    TerminalDetector,
-    TerminalCapabilities,
-    TerminalType,
-    ColorSupport,
-    detect_terminal_capabilities,
-    get_optimal_consciousness_settings
-)
+# Utilities are imported on first attribute access (PEP 562) so that importing
+# the package does not load submodules the caller never touches
+_LAZY_EXPORTS = {
+    # Terminal Detection
+    'TerminalDetector': 'terminal_detection',
+    'TerminalCapabilities': 'terminal_detection',
+    'TerminalType': 'terminal_detection',
+    'ColorSupport': 'terminal_detection',
+    'detect_terminal_capabilities': 'terminal_detection',
+    'get_optimal_consciousness_settings': 'terminal_detection',
+    
+    # Unicode Fallbacks
+    'UnicodeFallbackManager': 'unicode_fallbacks',
+    'ConsciousnessSymbolMapper': 'unicode_fallbacks',
+    'FallbackLevel': 'unicode_fallbacks',
+    'FallbackSettings': 'unicode_fallbacks',
+    'create_fallback_manager': 'unicode_fallbacks',
+    'create_consciousness_symbol_mapper': 'unicode_fallbacks',
+    
+    # Real-time Updates
+    'RealTimeUpdater': 'real_time_updater',
+    'SmoothAnimationManager': 'real_time_updater',
+    'UpdateType': 'real_time_updater',
+    'AnimationStyle': 'real_time_updater',
+    'UpdateFrame': 'real_time_updater',
+    'AnimationState': 'real_time_updater',
+    'create_real_time_updater': 'real_time_updater',
+    'create_smooth_animation_manager': 'real_time_updater'
+}
+
+
+def __getattr__(name: str):
+    """Import a utility from its submodule on first access and cache it."""
+    
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
 
-from .unicode_fallbacks import (
-    UnicodeFallbackManager,
-    ConsciousnessSymbolMapper,
-    FallbackLevel,
-    FallbackSettings,
-    create_fallback_manager,
-    create_consciousness_symbol_mapper
-)
 
-from .real_time_updater import (
-    RealTimeUpdater,
-    SmoothAnimationManager,
-    UpdateType,
-    AnimationStyle,
-    UpdateFrame,
-    AnimationState,
-    create_real_time_updater,
-    create_smooth_animation_manager
-)
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # PACKAGE LEVEL EXPORTS
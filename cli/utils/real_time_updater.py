@@ -12,14 +12,20 @@ while maintaining optimal performance across different terminal capabilities.
 """
 
 import time
+import asyncio
 import threading
-import queue
 import math
+import re
 import sys
-from typing import Dict, Any, List, Optional, Callable, Tuple, Union
+import shutil
+import unicodedata
+from typing import Dict, Any, List, NamedTuple, Optional, Callable, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 from collections import deque
+from itertools import zip_longest
+from bisect import bisect_left
+from functools import lru_cache
 import logging
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -84,26 +90,141 @@ DEFAULT_ANIMATION_PARAMS = {
     }
 }
 
+# Frames rendered as line diffs before forcing a full-screen redraw
+FULL_REDRAW_INTERVAL = 60
+
+# ANSI escape sequences take up no screen columns
+_ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]')
+
+# Emoji presentation selector; it widens the glyph before it to two columns
+_EMOJI_PRESENTATION = '\ufe0f'
+
+def _display_width(line: str) -> int:
+    """Terminal columns a line occupies: escapes take none, wide glyphs take two."""
+    
+    text = _ANSI_ESCAPE.sub('', line)
+    if text.isascii():
+        return len(text)
+    
+    width = 0
+    for char in text:
+        if char == _EMOJI_PRESENTATION:
+            width += 1
+        elif unicodedata.combining(char) or unicodedata.category(char) in ('Mn', 'Me', 'Cf'):
+            continue
+        else:
+            width += 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+    
+    return width
+
+# Adaptive frame rate: smoothing of the render-time average and frames measured before adjusting
+FRAME_TIME_EWMA_ALPHA = 0.1
+FRAME_RATE_WARMUP_FRAMES = 10
+
 @dataclass
 class UpdateFrame:
     """Represents a single display frame update."""
     content: List[str]
-    timestamp: float = field(default_factory=time.time)
+    timestamp: float = field(default_factory=time.monotonic)  # Monotonic clock, like all frame scheduling
     frame_number: int = 0
     animation_phase: float = 0.0
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+class FrameRecord(NamedTuple):
+    """Timing metadata kept for a rendered frame (the content itself is not retained)."""
+    timestamp: float
+    frame_number: int
+    animation_phase: float
+    render_time: float
+
 @dataclass
 class AnimationState:
     """Tracks the state of an ongoing animation."""
     frame_count: int = 0
-    start_time: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=time.monotonic)
     current_phase: float = 0.0
     direction: int = 1
     cycle_count: int = 0
     is_active: bool = True
     parameters: Dict[str, Any] = field(default_factory=dict)
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# PATTERN TABLES
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# Angle constants used by the per-frame pattern builders
+_HALF_PI = math.pi / 2
+_TWO_PI = 2 * math.pi
+_FOUR_PI = 4 * math.pi
+
+# Golden ratio exponent for the golden_ratio easing
+_INV_PHI = 1 / 1.618033988749895
+
+# Biofield wave frequency multipliers per component (unlisted components use 1.0)
+BIOFIELD_WAVE_FREQUENCIES = {
+    'schumann': 1.0,
+    'solfeggio': 1.618,
+    'golden_ratio': 0.618
+}
+
+# Wave glyphs by amplitude bucket; a value belongs to the bucket above each bound it exceeds
+_WAVE_BOUNDS = (-0.3, 0.0, 0.3, 0.6)
+_WAVE_GLYPHS = (' ', '·', '∙', '⌇', '∿')
+
+# Mandala glyphs by pattern value: <= 0, <= 0.5, above
+_MANDALA_BOUNDS = (0.0, 0.5)
+_MANDALA_GLYPHS = ('○', '◎', '◉')
+
+@lru_cache(maxsize=8)
+def _mandala_geometry(size: int) -> Tuple[Tuple[int, Tuple[float, ...], Tuple[float, ...]], ...]:
+    """Phase-independent mandala geometry: per row, dy² and sin/cos of 4θ for each cell."""
+    
+    rows = []
+    for y in range(size):
+        dy = y - size // 2
+        angles = [math.atan2(dy, x - size) * 4 for x in range(size * 2)]
+        rows.append((dy * dy, tuple(map(math.sin, angles)), tuple(map(math.cos, angles))))
+    return tuple(rows)
+
+# Time flow glyphs by wave value, bucketed like the biofield wave
+_FLOW_BOUNDS = (0.0, 0.3, 0.7)
+_FLOW_GLYPHS = (' ', '·', '›', '»')
+
+@lru_cache(maxsize=32)
+def _time_flow_table(width: int) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """Phase-independent sin/cos of each column's position in one flow cycle."""
+    
+    positions = [(i / width) * _TWO_PI for i in range(width)]
+    return tuple(map(math.sin, positions)), tuple(map(math.cos, positions))
+
+# Progress animation glyphs, indexed by half-cycle (fill) and quarter-cycle (indicator) parity
+_PROGRESS_FILL_GLYPHS = ('█', '▓')
+_PROGRESS_INDICATOR_GLYPHS = ('◆', '◇')
+_PHASE_SYMBOLS = ('◐', '◓', '◑', '◒')
+
+@lru_cache(maxsize=32)
+def _biofield_wave_table(width: int, frequency: float) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """Phase-independent sin/cos of each column's wave position for a given width."""
+    
+    positions = [(i / width) * _FOUR_PI * frequency for i in range(width)]
+    return tuple(map(math.sin, positions)), tuple(map(math.cos, positions))
+
+def _set_timer_resolution(high: bool) -> None:
+    """Request (or release) 1 ms timer resolution on Windows; no-op elsewhere."""
+    
+    if sys.platform != 'win32':
+        return
+    
+    try:
+        import ctypes
+        winmm = ctypes.WinDLL('winmm')
+        if high:
+            winmm.timeBeginPeriod(1)
+        else:
+            winmm.timeEndPeriod(1)
+    except (ImportError, OSError, AttributeError):
+        pass
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # REAL-TIME UPDATER CLASS
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -129,12 +250,19 @@ class RealTimeUpdater:
         self.params = DEFAULT_ANIMATION_PARAMS[animation_style].copy()
         self.params['fps'] = fps
         
+        # Per-frame reads of the style parameters (params is fixed after construction)
+        self._wave_frequency = self.params.get('wave_frequency', 1.0)
+        self._original_fps = fps
+        
         # State tracking
         self.is_running = False
         self.update_thread = None
-        self.update_queue = queue.Queue()
+        self.update_queue = deque()  # single consumer (the update thread); deque ops are atomic
         self.animation_states = {}
+        self._active_animations = ()  # (state, guarded callback, duration, loop) per active animation
+        self._active_animations_lock = threading.Lock()  # serializes snapshot rebuilds across threads
         self.last_frame_time = 0.0
+        self._next_frame_deadline = 0.0  # perf_counter time of the next scheduled frame
         self.frame_count = 0
         
         # Performance metrics
@@ -148,7 +276,12 @@ class RealTimeUpdater:
         # Display buffer management
         self.display_buffer = []
         self.max_buffer_size = 100
-        self.frame_history = deque(maxlen=60)  # Keep 10 seconds at 6fps
+        self.frame_history = deque(maxlen=60)  # FrameRecords for 10 seconds at 6fps
+        
+        # Last full-screen frame on the terminal, used to redraw only changed lines
+        self._previous_frame = None
+        self._frames_since_redraw = 0
+        self._terminal_size = None
         
         # Terminal control sequences
         self.clear_screen = '\033[2J\033[H'
@@ -164,25 +297,55 @@ class RealTimeUpdater:
         # Adaptive performance
         self.adaptive_fps = True
         self.target_frame_time = self.frame_interval
-        self.performance_window = deque(maxlen=30)
+        self._average_frame_time = 0.0  # EWMA of render time, mirrored into performance_metrics on report
+        self._frames_measured = 0
     
     def start(self) -> None:
-        """Start the real-time update loop."""
+        """Start the real-time update loop in a background thread."""
         if self.is_running:
             return
         
-        self.is_running = True
-        self.frame_count = 0
-        self.last_frame_time = time.time()
-        
-        # Hide cursor for smooth animations
-        print(self.hide_cursor, end='', flush=True)
+        self._begin_updates()
         
         # Start update thread
         self.update_thread = threading.Thread(target=self._update_loop, daemon=True)
         self.update_thread.start()
         
-        logging.info(f"Real-time updater started at {self.fps} FPS")
+        logger.info("Real-time updater started at %s FPS", self.fps)
+    
+    async def run(self) -> None:
+        """
+        Run the update loop as a task on the caller's asyncio event loop.
+        
+        Use this instead of start() in asyncio applications; it returns once
+        stop() is called (or the task is cancelled).
+        """
+        if self.is_running:
+            return
+        
+        self._begin_updates()
+        logger.info("Real-time updater running at %s FPS", self.fps)
+        
+        try:
+            while self.is_running:
+                await asyncio.sleep(max(0.0, self._update_tick()))
+        finally:
+            self.stop()
+    
+    def _begin_updates(self) -> None:
+        """Reset loop state and prepare the terminal for animation."""
+        
+        self.is_running = True
+        self.frame_count = 0
+        self.last_frame_time = time.monotonic()
+        self._next_frame_deadline = time.perf_counter() + self.target_frame_time
+        self._previous_frame = None
+        
+        # Sleep granularity otherwise caps Windows at ~64 wake-ups per second
+        _set_timer_resolution(True)
+        
+        # Hide cursor for smooth animations
+        print(self.hide_cursor, end='', flush=True)
     
     def stop(self) -> None:
         """Stop the real-time update loop."""
@@ -195,10 +358,12 @@ class RealTimeUpdater:
         if self.update_thread and self.update_thread.is_alive():
             self.update_thread.join(timeout=1.0)
         
+        _set_timer_resolution(False)
+        
         # Show cursor
         print(self.show_cursor, end='', flush=True)
         
-        logging.info("Real-time updater stopped")
+        logger.info("Real-time updater stopped")
     
     def register_animation(self, 
                           animation_id: str, 
@@ -216,6 +381,9 @@ class RealTimeUpdater:
             duration: Duration in seconds (None for infinite)
             loop: Whether to loop the animation
         """
+        if not callable(update_callback):
+            raise TypeError(f"update_callback for animation '{animation_id}' must be callable")
+        
         animation_state = AnimationState(
             parameters={
                 'callback': update_callback,
@@ -227,14 +395,47 @@ class RealTimeUpdater:
         )
         
         self.animation_states[animation_id] = animation_state
-        logging.debug(f"Registered animation: {animation_id}")
+        self._refresh_active_animations()
+        logger.debug("Registered animation: %s", animation_id)
     
     def unregister_animation(self, animation_id: str) -> None:
         """Remove an animation from the update loop."""
         if animation_id in self.animation_states:
             self.animation_states[animation_id].is_active = False
             del self.animation_states[animation_id]
-            logging.debug(f"Unregistered animation: {animation_id}")
+            self._refresh_active_animations()
+            logger.debug("Unregistered animation: %s", animation_id)
+    
+    def _refresh_active_animations(self) -> None:
+        """Rebuild the snapshot of active animations iterated by the update loop."""
+        
+        # Registration parameters are unpacked here so the frame loop does no dict lookups.
+        # The update thread and registering threads both rebuild; holding the lock across
+        # snapshot and assignment keeps an older snapshot from replacing a newer one
+        with self._active_animations_lock:
+            self._active_animations = tuple(
+                (state,
+                 self._guard_callback(animation_id, state),
+                 state.parameters.get('duration'),
+                 state.parameters.get('loop', False))
+                for animation_id, state in list(self.animation_states.items())
+                if state.is_active
+            )
+    
+    def _guard_callback(self, animation_id: str, state: AnimationState) -> Callable[[float, int], Optional[List[str]]]:
+        """Wrap an animation callback so a failure disables only that animation."""
+        
+        callback = state.parameters['callback']
+        
+        def guarded(elapsed: float, frame_count: int) -> Optional[List[str]]:
+            try:
+                return callback(elapsed, frame_count)
+            except Exception as e:
+                logger.error("Error updating animation %s: %s", animation_id, e)
+                state.is_active = False
+                return None
+        
+        return guarded
     
     def update_display_immediate(self, content: List[str], clear_screen: bool = True) -> None:
         """Immediately update the display with new content."""
@@ -243,6 +444,8 @@ class RealTimeUpdater:
             frame_number=self.frame_count
         )
         
+        # The caller may have written to the terminal since the last frame
+        self._previous_frame = None
         self._render_frame(frame, clear_screen)
     
     def create_consciousness_animation(self, 
@@ -281,13 +484,15 @@ class RealTimeUpdater:
     
     def create_biofield_flow_animation(self, 
                                      coherence_data: Dict[str, float],
-                                     animation_phase: float) -> List[str]:
+                                     animation_phase: float,
+                                     overall_coherence: Optional[float] = None) -> List[str]:
         """
         Create biofield flow animation frame.
         
         Args:
             coherence_data: Biofield coherence levels
             animation_phase: Current animation phase (0.0-1.0)
+            overall_coherence: Mean coherence, if the caller already tracks it
             
         Returns:
             Animation frame content
@@ -302,7 +507,8 @@ class RealTimeUpdater:
             lines.append(f"{component.title():>12}: {wave_line}")
         
         # Add overall coherence visualization
-        overall_coherence = sum(coherence_data.values()) / len(coherence_data)
+        if overall_coherence is None:
+            overall_coherence = sum(coherence_data.values()) / len(coherence_data)
         coherence_viz = self._create_coherence_mandala(overall_coherence, animation_phase, height)
         lines.extend([''] + coherence_viz)
         
@@ -345,98 +551,113 @@ class RealTimeUpdater:
         """Main update loop running in separate thread."""
         
         while self.is_running:
-            loop_start_time = time.time()
-            
-            try:
-                # Calculate animation phase
-                elapsed_time = loop_start_time - self.last_frame_time
+            sleep_time = self._update_tick()
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+        
+        logger.info("Update loop terminated")
+    
+    def _update_tick(self) -> float:
+        """Run one pass of the update loop; returns the time left until the next pass."""
+        
+        tick_start = time.perf_counter()
+        
+        try:
+            if tick_start >= self._next_frame_deadline:
+                # Frames are scheduled on fixed deadlines so sleep overshoot does not accumulate;
+                # after an overrun, resync instead of bursting to catch up
+                self._next_frame_deadline += self.target_frame_time
+                if self._next_frame_deadline <= tick_start:
+                    self._next_frame_deadline = tick_start + self.target_frame_time
                 
-                if elapsed_time >= self.target_frame_time:
-                    # Update all active animations
-                    frame_content = self._update_all_animations(loop_start_time)
-                    
-                    if frame_content:
-                        frame = UpdateFrame(
-                            content=frame_content,
-                            timestamp=loop_start_time,
-                            frame_number=self.frame_count,
-                            animation_phase=self._calculate_animation_phase(loop_start_time)
-                        )
-                        
-                        # Render frame
-                        render_start = time.time()
-                        self._render_frame(frame)
-                        render_time = time.time() - render_start
-                        
-                        # Update performance metrics
-                        self._update_performance_metrics(render_time)
-                        
-                        self.last_frame_time = loop_start_time
-                        self.frame_count += 1
-                        
-                        # Add to history
-                        self.frame_history.append(frame)
+                loop_start_time = time.monotonic()
                 
-                # Adaptive frame rate adjustment
-                if self.adaptive_fps:
-                    self._adjust_frame_rate()
+                # Update all active animations
+                frame_content = self._update_all_animations(loop_start_time)
                 
-                # Sleep to maintain target FPS
-                sleep_time = self.target_frame_time - (time.time() - loop_start_time)
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                if frame_content:
+                    frame = UpdateFrame(
+                        content=frame_content,
+                        timestamp=loop_start_time,
+                        frame_number=self.frame_count,
+                        animation_phase=self._calculate_animation_phase(loop_start_time)
+                    )
                     
-            except Exception as e:
-                logging.error(f"Error in update loop: {e}")
-                # Continue running but log the error
+                    # Render frame
+                    render_start = time.perf_counter()
+                    self._render_frame(frame)
+                    render_time = time.perf_counter() - render_start
+                    
+                    # Update performance metrics
+                    self._update_performance_metrics(render_time)
+                    
+                    self.last_frame_time = loop_start_time
+                    self.frame_count += 1
+                    
+                    # Add to history
+                    self.frame_history.append(FrameRecord(
+                        frame.timestamp, frame.frame_number, frame.animation_phase, render_time
+                    ))
+            
+            # Adaptive frame rate adjustment
+            if self.adaptive_fps:
+                self._adjust_frame_rate()
+                
+        except Exception as e:
+            logger.error("Error in update loop: %s", e)
+            # Continue running but log the error
         
-        logging.info("Update loop terminated")
+        # Sleep until the next frame deadline
+        return self._next_frame_deadline - time.perf_counter()
     
     def _update_all_animations(self, current_time: float) -> Optional[List[str]]:
         """Update all registered animations and return combined content."""
         
         combined_content = []
-        active_animations = []
+        current_phase = self._calculate_animation_phase(current_time)
+        deactivated = False
         
-        for animation_id, state in list(self.animation_states.items()):
+        for state, callback, duration, loop in self._active_animations:
             if not state.is_active:
+                deactivated = True
                 continue
             
-            try:
-                # Calculate animation progress
-                elapsed = current_time - state.start_time
-                callback = state.parameters['callback']
-                
-                # Get frame from animation callback
-                frame_content = callback(elapsed, state.frame_count)
-                
-                if frame_content:
-                    # Add separator if multiple animations
-                    if combined_content and frame_content:
-                        combined_content.append('')
-                    
-                    combined_content.extend(frame_content)
-                    active_animations.append(animation_id)
-                
-                # Update animation state
-                state.frame_count += 1
-                state.current_phase = self._calculate_animation_phase(current_time)
+            # Calculate animation progress
+            elapsed = current_time - state.start_time
+            
+            # Get frame from animation callback
+            frame_content = callback(elapsed, state.frame_count)
+            if not state.is_active:
+                # Callback failed and was disabled
+                deactivated = True
+                continue
+            
+            if frame_content:
+                # Add separator if multiple animations
+                if combined_content:
+                    combined_content.append('')
                 
-                # Check if animation should end
-                duration = state.parameters.get('duration')
-                if duration and elapsed >= duration:
-                    if state.parameters.get('loop', False):
-                        # Restart animation
-                        state.start_time = current_time
-                        state.frame_count = 0
-                        state.cycle_count += 1
-                    else:
-                        # End animation
-                        state.is_active = False
-                        
-            except Exception as e:
-                logging.error(f"Error updating animation {animation_id}: {e}")
-                state.is_active = False
+                combined_content.extend(frame_content)
+            
+            # Update animation state
+            state.frame_count += 1
+            state.current_phase = current_phase
+            
+            # Check if animation should end
+            if duration and elapsed >= duration:
+                if loop:
+                    # Restart animation
+                    state.start_time = current_time
+                    state.frame_count = 0
+                    state.cycle_count += 1
+                else:
+                    # End animation
+                    state.is_active = False
+                    deactivated = True
+        
+        # Drop finished or failed animations from the next frame's iteration
+        if deactivated:
+            self._refresh_active_animations()
         
         return combined_content if combined_content else None
     
@@ -444,44 +665,91 @@ class RealTimeUpdater:
         """Render a frame to the terminal."""
         
         try:
-            # Clear screen if requested
-            if clear:
-                print(self.clear_screen, end='')
-            else:
-                print(self.save_cursor, end='')
+            terminal_size = shutil.get_terminal_size() if clear else None
             
-            # Render content
-            for line in frame.content:
-                print(line)
+            if clear and self._can_diff_render(frame.content, terminal_size):
+                self._frames_since_redraw += 1
+                
+                # Identical frames need no terminal output at all
+                if frame.content == self._previous_frame:
+                    return
+                
+                # Rewrite only the lines that changed since the previous frame
+                output = self._build_frame_diff(frame.content)
+            else:
+                # Build the whole frame first so it reaches the terminal in a single write
+                content = ''.join([f"{line}\n" for line in frame.content])
+                
+                if clear:
+                    output = self.clear_screen + content
+                    self._frames_since_redraw = 0
+                    self._terminal_size = terminal_size
+                else:
+                    output = self.save_cursor + content + self.restore_cursor
             
-            # Restore cursor if not clearing
-            if not clear:
-                print(self.restore_cursor, end='')
+            # Partial updates leave the screen contents unknown
+            self._previous_frame = list(frame.content) if clear else None
             
+            sys.stdout.write(output)
             sys.stdout.flush()
             
         except Exception as e:
-            logging.error(f"Error rendering frame: {e}")
+            logger.error("Error rendering frame: %s", e)
+    
+    def _can_diff_render(self, content: List[str], terminal_size: Tuple[int, int]) -> bool:
+        """Check whether the next full-screen frame can be drawn as a line diff."""
+        
+        if self._previous_frame is None or self._frames_since_redraw >= FULL_REDRAW_INTERVAL:
+            return False
+        
+        # A resize reflows the screen, so the previous frame no longer matches it
+        if terminal_size != self._terminal_size:
+            return False
+        
+        # Rows are addressed absolutely, so both the frame on screen and the new one
+        # must give each line exactly one row without scrolling the terminal
+        columns, lines = self._terminal_size
+        return (self._fits_screen(content, columns, lines) and
+                self._fits_screen(self._previous_frame, columns, lines))
+    
+    @staticmethod
+    def _fits_screen(content: List[str], columns: int, lines: int) -> bool:
+        """Check that no line wraps and a full redraw of the content would not scroll."""
+        
+        if len(content) >= lines:
+            return False
+        
+        for line in content:
+            # No character is wider than two columns, so short lines need no measuring
+            if len(line) * 2 > columns and _display_width(line) > columns:
+                return False
+        
+        return True
+    
+    def _build_frame_diff(self, content: List[str]) -> str:
+        """Build cursor-addressed rewrites for lines that differ from the previous frame."""
+        
+        parts = []
+        
+        for row, (line, previous_line) in enumerate(zip_longest(content, self._previous_frame), 1):
+            if line != previous_line:
+                parts.append(f"\033[{row};1H\033[2K{line if line is not None else ''}")
+        
+        # Leave the cursor where a full redraw would
+        parts.append(f"\033[{len(content) + 1};1H")
+        
+        return ''.join(parts)
     
     def _calculate_animation_phase(self, current_time: float) -> float:
         """Calculate current animation phase based on style and time."""
         
-        # Base phase calculation
-        if self.golden_ratio_timing:
-            # Use golden ratio for natural timing
-            phase_multiplier = 0.618  # Golden ratio inverse
-        else:
-            phase_multiplier = 1.0
+        # Golden ratio inverse for natural timing
+        phase_multiplier = 0.618 if self.golden_ratio_timing else 1.0
         
-        if self.biofield_sync_enabled:
-            # Sync to Schumann resonance (7.83 Hz)
-            phase = (current_time * 7.83 * phase_multiplier) % 1.0
-        else:
-            # Use animation style parameters
-            frequency = self.params.get('wave_frequency', 1.0)
-            phase = (current_time * frequency * phase_multiplier) % 1.0
+        # Sync to Schumann resonance (7.83 Hz) or use the animation style frequency
+        frequency = 7.83 if self.biofield_sync_enabled else self._wave_frequency
         
-        return phase
+        return (current_time * frequency * phase_multiplier) % 1.0
     
     def _create_consciousness_timeline(self, 
                                      states: List[str], 
@@ -495,8 +763,8 @@ class RealTimeUpdater:
             return lines
         
         # Create timeline
-        timeline = ""
         state_width = width // len(states)
+        segments = []
         
         for i, state in enumerate(states):
             if i == current_index:
@@ -506,22 +774,20 @@ class RealTimeUpdater:
             else:
                 symbol = '○'
             
-            state_segment = f"{symbol} {state[:state_width-3]}"
-            timeline += state_segment.ljust(state_width)
+            segments.append(f"{symbol} {state[:state_width-3]}".ljust(state_width))
         
-        lines.append(timeline[:width])
+        lines.append(''.join(segments)[:width])
         
         # Add progress line
-        progress_line = ""
-        total_segments = len(states)
-        for i in range(total_segments):
-            segment_chars = width // total_segments
-            if i < current_index:
-                progress_line += '━' * segment_chars
-            elif i == current_index:
-                progress_line += '◉' + '━' * (segment_chars - 1)
-            else:
-                progress_line += '┅' * segment_chars
+        segment_chars = width // len(states)
+        done_segment = '━' * segment_chars
+        current_segment = '◉' + '━' * (segment_chars - 1)
+        pending_segment = '┅' * segment_chars
+        
+        progress_line = ''.join([
+            done_segment if i < current_index else current_segment if i == current_index else pending_segment
+            for i in range(len(states))
+        ])
         
         lines.append(progress_line[:width])
         
@@ -536,20 +802,18 @@ class RealTimeUpdater:
         
         lines = []
         
-        # Transition line
+        # Transition line: travelled track, marker, remaining track
+        track_width = width - 8
         transition_pos = int(progress * (width - 6))
-        transition_line = f"{from_state[:3]} "
         
-        for i in range(width - 8):
-            if i == transition_pos:
-                transition_line += '●'
-            elif i < transition_pos:
-                transition_line += '─'
-            else:
-                transition_line += '╌'
+        if 0 <= transition_pos < track_width:
+            track = '─' * transition_pos + '●' + '╌' * (track_width - transition_pos - 1)
+        elif transition_pos >= track_width:
+            track = '─' * track_width
+        else:
+            track = '╌' * track_width
         
-        transition_line += f" {to_state[:3]}"
-        lines.append(transition_line)
+        lines.append(f"{from_state[:3]} {track} {to_state[:3]}")
         
         # Progress percentage
         lines.append(f"Transition Progress: {progress:.1%}".center(width))
@@ -563,36 +827,17 @@ class RealTimeUpdater:
                             width: int) -> str:
         """Create biofield wave pattern."""
         
-        wave = ""
+        sin_x, cos_x = _biofield_wave_table(width, BIOFIELD_WAVE_FREQUENCIES.get(component, 1.0))
         
-        for i in range(width):
-            x = (i / width) * 4 * math.pi
-            
-            # Component-specific wave patterns
-            if component == 'schumann':
-                wave_value = math.sin(x + phase * 2 * math.pi) * coherence
-            elif component == 'solfeggio':
-                wave_value = math.sin(x * 1.618 + phase * 2 * math.pi) * coherence
-            elif component == 'golden_ratio':
-                wave_value = math.sin(x * 0.618 + phase * 2 * math.pi) * coherence
-            else:
-                wave_value = math.sin(x + phase * 2 * math.pi) * coherence
-            
-            # Convert to character
-            if wave_value > 0.6:
-                char = '∿'
-            elif wave_value > 0.3:
-                char = '⌇'
-            elif wave_value > 0.0:
-                char = '∙'
-            elif wave_value > -0.3:
-                char = '·'
-            else:
-                char = ' '
-            
-            wave += char
+        # sin(x + p) = sin(x)cos(p) + cos(x)sin(p), so only the phase terms change per frame
+        phase_rad = phase * _TWO_PI
+        cos_p = math.cos(phase_rad) * coherence
+        sin_p = math.sin(phase_rad) * coherence
         
-        return wave
+        return ''.join([
+            _WAVE_GLYPHS[bisect_left(_WAVE_BOUNDS, sx * cos_p + cx * sin_p)]
+            for sx, cx in zip(sin_x, cos_x)
+        ])
     
     def _create_coherence_mandala(self, 
                                 coherence: float, 
@@ -601,35 +846,36 @@ class RealTimeUpdater:
         """Create animated coherence mandala."""
         
         lines = []
-        center_y = size // 2
-        
-        for y in range(size):
-            line = ""
-            for x in range(size * 2):  # Wider for better proportions
-                dx = x - size
-                dy = y - center_y
-                distance = (dx * dx + dy * dy) ** 0.5
-                
-                # Animated radius based on coherence and phase
-                animated_radius = size * 0.3 * coherence * (1 + 0.2 * math.sin(phase * 2 * math.pi))
-                
-                if distance < animated_radius:
-                    # Inside mandala
-                    angle = math.atan2(dy, dx)
-                    pattern_value = math.sin(angle * 4 + phase * 2 * math.pi) * coherence
-                    
-                    if pattern_value > 0.5:
-                        char = '◉'
-                    elif pattern_value > 0:
-                        char = '◎'
-                    else:
-                        char = '○'
-                else:
-                    char = ' '
-                
-                line += char
+        
+        # Radius and phase terms are the same for every cell of the frame
+        phase_rad = phase * _TWO_PI
+        animated_radius = size * 0.3 * coherence * (1 + 0.2 * math.sin(phase_rad))
+        if animated_radius <= 0:
+            return [''] * size
+        radius_sq = animated_radius * animated_radius
+        
+        # sin(4θ + p) = sin(4θ)cos(p) + cos(4θ)sin(p); the 4θ terms are cached per size
+        cos_p = math.cos(phase_rad) * coherence
+        sin_p = math.sin(phase_rad) * coherence
+        
+        for dy_sq, sin_row, cos_row in _mandala_geometry(size):
+            if dy_sq >= radius_sq:
+                lines.append('')
+                continue
             
-            lines.append(line.rstrip())
+            # Cells inside the radius form one run centred on x == size
+            reach = int(math.sqrt(radius_sq - dy_sq))
+            while reach * reach + dy_sq >= radius_sq:
+                reach -= 1
+            while (reach + 1) * (reach + 1) + dy_sq < radius_sq:
+                reach += 1
+            start = max(0, size - reach)
+            stop = min(size * 2, size + reach + 1)  # Wider for better proportions
+            
+            lines.append(' ' * start + ''.join([
+                _MANDALA_GLYPHS[bisect_left(_MANDALA_BOUNDS, sin_row[x] * cos_p + cos_row[x] * sin_p)]
+                for x in range(start, stop)
+            ]))
         
         return lines
     
@@ -641,25 +887,15 @@ class RealTimeUpdater:
         
         filled_count = int(progress * width)
         
-        # Animated fill character
-        if math.sin(phase * 2 * math.pi) > 0:
-            fill_char = '█'
+        # Fill glyph alternates each half cycle, the indicator each quarter cycle
+        fill_char = _PROGRESS_FILL_GLYPHS[math.floor(phase * 2) & 1]
+        
+        if progress < 1.0 and 0 <= filled_count < width:
+            # Moving indicator at the progress position
+            indicator = _PROGRESS_INDICATOR_GLYPHS[math.floor(phase * 4) & 1]
+            bar = fill_char * filled_count + indicator + '░' * (width - filled_count - 1)
         else:
-            fill_char = '▓'
-        
-        # Create bar
-        bar = fill_char * filled_count + '░' * (width - filled_count)
-        
-        # Add moving indicator at progress position if not complete
-        if progress < 1.0 and filled_count < width:
-            bar_list = list(bar)
-            if filled_count < len(bar_list):
-                # Animated progress indicator
-                if math.sin(phase * 4 * math.pi) > 0:
-                    bar_list[filled_count] = '◆'
-                else:
-                    bar_list[filled_count] = '◇'
-            bar = ''.join(bar_list)
+            bar = fill_char * filled_count + '░' * (width - filled_count)
         
         return f"[{bar}]"
     
@@ -667,31 +903,22 @@ class RealTimeUpdater:
         """Get animated symbol for current phase."""
         
         # Cycle through different symbols
-        symbols = ['◐', '◓', '◑', '◒']
-        symbol_index = int(phase * len(symbols)) % len(symbols)
-        return symbols[symbol_index]
+        return _PHASE_SYMBOLS[int(phase * len(_PHASE_SYMBOLS)) % len(_PHASE_SYMBOLS)]
     
     def _create_time_flow_pattern(self, phase: float, width: int) -> str:
         """Create flowing time pattern."""
         
-        pattern = ""
+        sin_x, cos_x = _time_flow_table(width)
         
-        for i in range(width):
-            # Create flowing pattern
-            flow_value = math.sin((i / width + phase) * 2 * math.pi)
-            
-            if flow_value > 0.7:
-                char = '»'
-            elif flow_value > 0.3:
-                char = '›'
-            elif flow_value > 0:
-                char = '·'
-            else:
-                char = ' '
-            
-            pattern += char
+        # sin(x + p) = sin(x)cos(p) + cos(x)sin(p), so only the phase terms change per frame
+        phase_rad = phase * _TWO_PI
+        cos_p = math.cos(phase_rad)
+        sin_p = math.sin(phase_rad)
         
-        return pattern
+        return ''.join([
+            _FLOW_GLYPHS[bisect_left(_FLOW_BOUNDS, sx * cos_p + cx * sin_p)]
+            for sx, cx in zip(sin_x, cos_x)
+        ])
     
     def _update_performance_metrics(self, render_time: float) -> None:
         """Update performance tracking metrics."""
@@ -699,11 +926,12 @@ class RealTimeUpdater:
         self.performance_metrics['frames_rendered'] += 1
         self.performance_metrics['last_update_duration'] = render_time
         
-        # Add to performance window for averaging
-        self.performance_window.append(render_time)
-        
-        if self.performance_window:
-            self.performance_metrics['average_frame_time'] = sum(self.performance_window) / len(self.performance_window)
+        # Exponentially weighted average, seeded with the first sample
+        if self._frames_measured:
+            self._average_frame_time += FRAME_TIME_EWMA_ALPHA * (render_time - self._average_frame_time)
+        else:
+            self._average_frame_time = render_time
+        self._frames_measured += 1
         
         # Check for dropped frames
         if render_time > self.target_frame_time * 1.5:
@@ -712,29 +940,30 @@ class RealTimeUpdater:
     def _adjust_frame_rate(self) -> None:
         """Adaptively adjust frame rate based on performance."""
         
-        if len(self.performance_window) < 10:
+        if self._frames_measured < FRAME_RATE_WARMUP_FRAMES:
             return
         
-        avg_frame_time = self.performance_metrics['average_frame_time']
+        avg_frame_time = self._average_frame_time
         
         # If consistently slow, reduce target FPS
         if avg_frame_time > self.target_frame_time * 1.3:
             self.fps = max(2, self.fps - 1)
             self.target_frame_time = 1.0 / self.fps
-            logging.info(f"Reduced FPS to {self.fps} due to performance")
+            logger.info("Reduced FPS to %s due to performance", self.fps)
         
         # If consistently fast and originally higher, increase FPS
         elif avg_frame_time < self.target_frame_time * 0.7 and self.fps < 10:
-            original_fps = self.params.get('fps', 6)
+            original_fps = self._original_fps
             if self.fps < original_fps:
                 self.fps = min(original_fps, self.fps + 1)
                 self.target_frame_time = 1.0 / self.fps
-                logging.info(f"Increased FPS to {self.fps}")
+                logger.info("Increased FPS to %s", self.fps)
     
     def get_performance_report(self) -> Dict[str, Any]:
         """Get current performance metrics."""
         
-        uptime = time.time() - (self.frame_history[0].timestamp if self.frame_history else time.time())
+        self.performance_metrics['average_frame_time'] = self._average_frame_time
+        uptime = time.monotonic() - (self.frame_history[0].timestamp if self.frame_history else time.monotonic())
         
         return {
             'fps': self.fps,
@@ -762,6 +991,8 @@ class SmoothAnimationManager:
     
     def __init__(self):
         self.active_transitions = {}
+        
+        # Easings are static, so transitions call plain functions rather than bound methods
         self.easing_functions = {
             'linear': self._ease_linear,
             'ease_in': self._ease_in,
@@ -791,87 +1022,127 @@ class SmoothAnimationManager:
         """
         transition_id = f"transition_{len(self.active_transitions)}"
         
+        # Interpolation terms are fixed for the transition's lifetime, so derive them once
+        if isinstance(from_value, dict) and isinstance(to_value, dict):
+            interp_terms = tuple(
+                (key, start, to_value[key] - start if key in to_value else 0.0)
+                for key, start in from_value.items()
+            )
+            delta = None
+        else:
+            interp_terms = None
+            delta = to_value - from_value
+        
         self.active_transitions[transition_id] = {
             'from_value': from_value,
             'to_value': to_value,
             'duration': duration,
-            'start_time': time.time(),
+            'start_time': time.monotonic(),
             'easing': easing,
-            'is_active': True
+            'is_active': True,
+            # Precomputed per-frame terms (a non-positive duration completes immediately)
+            'inv_duration': 1.0 / duration if duration > 0 else math.inf,
+            'easing_func': self.easing_functions.get(easing, self._ease_linear),
+            'delta': delta,
+            'interp_terms': interp_terms
         }
         
         return transition_id
     
-    def get_transition_value(self, transition_id: str) -> Optional[Union[float, Dict[str, float]]]:
-        """Get current interpolated value for a transition."""
+    def get_transition_value(self, transition_id: str,
+                             now: Optional[float] = None) -> Optional[Union[float, Dict[str, float]]]:
+        """
+        Get current interpolated value for a transition.
         
-        if transition_id not in self.active_transitions:
+        Args:
+            transition_id: Transition to evaluate
+            now: time.monotonic() timestamp of the frame; read from the clock if omitted
+        """
+        transition = self.active_transitions.get(transition_id)
+        if transition is None:
             return None
         
-        transition = self.active_transitions[transition_id]
+        return self._evaluate_transition(transition, time.monotonic() if now is None else now)
+    
+    def get_all_transition_values(self, now: Optional[float] = None) -> Dict[str, Union[float, Dict[str, float]]]:
+        """
+        Get current values for every transition in one pass.
+        
+        Reads the clock at most once, so all values belong to the same instant;
+        prefer this over per-transition calls when updating a whole frame.
+        """
+        if now is None:
+            now = time.monotonic()
+        evaluate = self._evaluate_transition
+        
+        return {
+            transition_id: evaluate(transition, now)
+            for transition_id, transition in self.active_transitions.items()
+        }
+    
+    def _evaluate_transition(self, transition: Dict[str, Any], now: float) -> Union[float, Dict[str, float]]:
+        """Interpolate a transition's value at the given monotonic time."""
         
         if not transition['is_active']:
             return transition['to_value']
         
-        # Calculate progress
-        elapsed = time.time() - transition['start_time']
-        progress = min(1.0, elapsed / transition['duration'])
+        # Calculate progress, clamped to [0, 1] for frame times taken before the
+        # transition started (min() also maps the NaN of 0 * inf to 1.0)
+        progress = max(0.0, min(1.0, (now - transition['start_time']) * transition['inv_duration']))
         
         # Apply easing
-        easing_func = self.easing_functions.get(transition['easing'], self._ease_linear)
-        eased_progress = easing_func(progress)
+        eased_progress = transition['easing_func'](progress)
         
         # Interpolate values
-        from_val = transition['from_value']
-        to_val = transition['to_value']
-        
-        if isinstance(from_val, dict) and isinstance(to_val, dict):
-            # Dictionary interpolation
-            result = {}
-            for key in from_val.keys():
-                if key in to_val:
-                    result[key] = from_val[key] + (to_val[key] - from_val[key]) * eased_progress
-                else:
-                    result[key] = from_val[key]
-            return result
-        else:
-            # Scalar interpolation
-            return from_val + (to_val - from_val) * eased_progress
+        interp_terms = transition['interp_terms']
+        if interp_terms is not None:
+            # Dictionary interpolation (keys missing from the target hold their start value)
+            return {key: start + delta * eased_progress for key, start, delta in interp_terms}
+        
+        # Scalar interpolation
+        return transition['from_value'] + transition['delta'] * eased_progress
     
-    def _ease_linear(self, t: float) -> float:
+    @staticmethod
+    def _ease_linear(t: float) -> float:
         """Linear easing function."""
         return t
     
-    def _ease_in(self, t: float) -> float:
+    @staticmethod
+    def _ease_in(t: float) -> float:
         """Ease in (slow start)."""
         return t * t
     
-    def _ease_out(self, t: float) -> float:
+    @staticmethod
+    def _ease_out(t: float) -> float:
         """Ease out (slow end)."""
         return 1 - (1 - t) * (1 - t)
     
-    def _ease_in_out(self, t: float) -> float:
+    @staticmethod
+    def _ease_in_out(t: float) -> float:
         """Ease in-out (slow start and end)."""
         if t < 0.5:
             return 2 * t * t
         else:
             return 1 - 2 * (1 - t) * (1 - t)
     
-    def _ease_consciousness_flow(self, t: float) -> float:
+    @staticmethod
+    def _ease_consciousness_flow(t: float) -> float:
         """Natural consciousness flow easing."""
         # Based on natural breathing rhythm
         return 0.5 * (1 - math.cos(t * math.pi))
     
-    def _ease_biofield_wave(self, t: float) -> float:
+    @staticmethod
+    def _ease_biofield_wave(t: float) -> float:
         """Biofield-inspired wave easing."""
         # Based on Schumann resonance pattern
-        return (math.sin(t * math.pi - math.pi/2) + 1) / 2
+        return (math.sin(t * math.pi - _HALF_PI) + 1) / 2
     
-    def _ease_golden_ratio(self, t: float) -> float:
+    @staticmethod
+    def _ease_golden_ratio(t: float) -> float:
         """Golden ratio-based easing."""
-        # Use golden ratio for natural timing
-        phi = 1.618033988749895
-        return math.pow(t, 1/phi)
+        # Use golden ratio for natural timing; the power is only real for t >= 0,
+        # so out-of-range input is returned as is rather than as a complex number
+        return t if t <= 0 else t ** _INV_PHI
 
 def create_real_time_updater(fps: int = 6, 
                            style: AnimationStyle = AnimationStyle.BALANCED) -> RealTimeUpdater:
@@ -894,4 +1165,11 @@ def create_smooth_animation_manager() -> SmoothAnimationManager:
     Returns:
         SmoothAnimationManager instance
     """
-    return SmoothAnimationManager()
\ No newline at end of file
+    return SmoothAnimationManager()
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# MODULE INITIALIZATION
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# Set up module-level logging
+logger = logging.getLogger(__name__)
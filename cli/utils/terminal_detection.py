@@ -14,10 +14,9 @@ on terminal features, ensuring beautiful displays across all environments.
 import os
 import sys
 import shutil
-import platform
-import subprocess
+from functools import lru_cache
 from typing import Dict, Any, Optional, Tuple, List
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -48,7 +47,7 @@ class ColorSupport(Enum):
     COLOR_256 = 256
     TRUE_COLOR = 16777216
 
-@dataclass
+@dataclass(slots=True)
 class TerminalCapabilities:
     """
     Complete terminal capability profile for consciousness-aware adaptation.
@@ -165,6 +164,103 @@ TERMINAL_CAPABILITIES_DB = {
     }
 }
 
+# Database entries keyed by TerminalType and reduced to (field, value) pairs
+# that TerminalCapabilities actually defines, so applying them needs no
+# per-key reflection
+_CAPABILITY_FIELDS = frozenset(f.name for f in fields(TerminalCapabilities))
+_TERMINAL_DB_OVERRIDES: Dict[TerminalType, Tuple[Tuple[str, Any], ...]] = {
+    terminal_type: tuple(
+        (key, value)
+        for key, value in TERMINAL_CAPABILITIES_DB[terminal_type.value].items()
+        if key in _CAPABILITY_FIELDS
+    )
+    for terminal_type in TerminalType
+    if terminal_type.value in TERMINAL_CAPABILITIES_DB
+}
+
+# Terminal groups used by the feature checks
+_ALTERNATE_BUFFER_TERMINALS = frozenset({
+    TerminalType.XTERM, TerminalType.TMUX, TerminalType.GNOME_TERMINAL,
+    TerminalType.KONSOLE, TerminalType.ITERM2
+})
+_UNICODE_TERMINALS = frozenset({
+    TerminalType.ITERM2, TerminalType.GNOME_TERMINAL, TerminalType.KONSOLE,
+    TerminalType.VSCODE
+})
+_MOUSE_TERMINALS = frozenset({
+    TerminalType.XTERM, TerminalType.TMUX, TerminalType.GNOME_TERMINAL,
+    TerminalType.KONSOLE, TerminalType.ITERM2
+})
+_BRACKETED_PASTE_TERMINALS = frozenset({
+    TerminalType.XTERM, TerminalType.GNOME_TERMINAL, TerminalType.KONSOLE,
+    TerminalType.ITERM2
+})
+_FOCUS_EVENT_TERMINALS = frozenset({TerminalType.ITERM2, TerminalType.GNOME_TERMINAL})
+_HYPERLINK_TERMINALS = frozenset({
+    TerminalType.ITERM2, TerminalType.GNOME_TERMINAL, TerminalType.WINDOWS_TERMINAL,
+    TerminalType.VSCODE
+})
+_FASTEST_TERMINALS = frozenset({TerminalType.ITERM2, TerminalType.WINDOWS_TERMINAL})
+_FAST_TERMINALS = frozenset({TerminalType.GNOME_TERMINAL, TerminalType.KONSOLE})
+_MEDITATION_TERMINALS = frozenset({TerminalType.ITERM2, TerminalType.VSCODE})
+_BASIC_COLOR_TERMS = frozenset({'xterm', 'screen', 'tmux'})
+_RICH_COLOR_SUPPORT = frozenset({ColorSupport.COLOR_256, ColorSupport.TRUE_COLOR})
+
+# Terminals whose color depth is known without inspecting the environment.
+# Only terminals detected off Windows are listed, since Windows consoles still
+# need virtual terminal processing enabled.
+_KNOWN_COLOR_SUPPORT = {
+    TerminalType.ITERM2: ColorSupport.TRUE_COLOR,
+    TerminalType.GNOME_TERMINAL: ColorSupport.TRUE_COLOR,
+    TerminalType.KONSOLE: ColorSupport.TRUE_COLOR
+}
+
+# Capability report marks, indexed by the feature flag
+_REPORT_MARKS = ('✗', '✓')
+
+def _apply_terminal_size(caps: TerminalCapabilities) -> None:
+    """Set the size fields from the current terminal size."""
+    
+    try:
+        size = shutil.get_terminal_size()
+        caps.width = size.columns
+        caps.height = size.lines
+    except Exception:
+        caps.width = 80
+        caps.height = 24
+    
+    # Set maximum recommended dimensions for consciousness displays
+    caps.max_width = min(120, caps.width)
+    caps.max_height = min(50, caps.height)
+
+@lru_cache(maxsize=1)
+def _enable_windows_vt_processing() -> Optional[bool]:
+    """
+    Enable ANSI escape processing on the Windows console, once per process.
+    
+    Returns:
+        Whether the console accepted the mode, or None if it could not be queried
+    """
+    try:
+        import ctypes
+        from ctypes import wintypes
+        
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        
+        # Get current console mode
+        mode = wintypes.DWORD()
+        kernel32.GetConsoleMode(handle, ctypes.byref(mode))
+        
+        # Enable virtual terminal processing
+        ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+        new_mode = mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        
+        return bool(kernel32.SetConsoleMode(handle, new_mode))
+    except Exception:
+        # Older Windows or ctypes unavailable
+        return None
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # TERMINAL DETECTOR CLASS
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -178,10 +274,19 @@ class TerminalDetector:
     geometry rendering based on the detected environment.
     """
     
+    # Last detected profile, shared process-wide so new detectors and the module
+    # helpers skip re-detection; callers must treat it as read-only
+    _shared_capabilities: Optional[TerminalCapabilities] = None
+    
     def __init__(self):
-        self.capabilities = TerminalCapabilities()
-        self._detection_cache = {}
-        
+        if TerminalDetector._shared_capabilities is not None:
+            self._cached_capabilities = TerminalDetector._shared_capabilities
+    
+    @property
+    def capabilities(self) -> TerminalCapabilities:
+        """Detected capabilities, running detection on first access."""
+        return self.detect_capabilities()
+    
     def detect_capabilities(self, force_redetect: bool = False) -> TerminalCapabilities:
         """
         Perform comprehensive terminal capability detection.
@@ -190,7 +295,7 @@ class TerminalDetector:
             force_redetect: Force re-detection even if cached
             
         Returns:
-            Complete terminal capabilities profile
+            Complete terminal capabilities profile, shared process-wide (do not mutate)
         """
         if not force_redetect and hasattr(self, '_cached_capabilities'):
             return self._cached_capabilities
@@ -219,81 +324,96 @@ class TerminalDetector:
         # Apply consciousness-aware optimizations
         self._apply_consciousness_optimizations(caps)
         
-        # Cache results
+        # Cache results for this and any later detector
         self._cached_capabilities = caps
+        TerminalDetector._shared_capabilities = caps
         return caps
     
     def _detect_operating_system(self, caps: TerminalCapabilities) -> None:
         """Detect operating system and set OS-specific flags."""
         
-        system = platform.system().lower()
-        caps.os_type = system
+        system = sys.platform
         
-        if system == 'windows':
+        if system.startswith('win'):
             caps.is_windows = True
+            caps.os_type = 'windows'
         elif system == 'darwin':
             caps.is_macos = True
-        elif system in ['linux', 'unix']:
+            caps.os_type = 'darwin'
+        elif system.startswith('linux'):
             caps.is_linux = True
+            caps.os_type = 'linux'
+        else:
+            caps.os_type = system.rstrip('0123456789')
     
     def _detect_terminal_type(self, caps: TerminalCapabilities) -> None:
         """Detect terminal type and version."""
         
         # Check environment variables for terminal identification
-        term_env = os.environ.get('TERM', '').lower()
-        term_program = os.environ.get('TERM_PROGRAM', '').lower()
-        term_program_version = os.environ.get('TERM_PROGRAM_VERSION', '')
+        env = os.environ
+        term_env = env.get('TERM', '').lower()
+        term_program = env.get('TERM_PROGRAM', '').lower()
+        
+        # IDE/Editor detection takes precedence over the host terminal
+        if env.get('VSCODE_PID') or 'vscode' in term_program:
+            caps.terminal_type = TerminalType.VSCODE
+            caps.terminal_name = 'VS Code Terminal'
+            return
+        if env.get('PYCHARM_HOSTED'):
+            caps.terminal_type = TerminalType.PYCHARM
+            caps.terminal_name = 'PyCharm Terminal'
+            return
+        if env.get('JPY_PARENT_PID'):
+            caps.terminal_type = TerminalType.JUPYTER
+            caps.terminal_name = 'Jupyter Terminal'
+            return
         
         # Windows-specific detection
         if caps.is_windows:
-            if 'windows terminal' in term_program or os.environ.get('WT_SESSION'):
+            if 'windows terminal' in term_program or env.get('WT_SESSION'):
                 caps.terminal_type = TerminalType.WINDOWS_TERMINAL
                 caps.terminal_name = 'Windows Terminal'
-            elif 'powershell' in term_program or 'pwsh' in os.environ.get('PSModulePath', ''):
+            elif 'powershell' in term_program or 'pwsh' in env.get('PSModulePath', ''):
                 caps.terminal_type = TerminalType.POWERSHELL
                 caps.terminal_name = 'PowerShell'
             else:
                 caps.terminal_type = TerminalType.CMD
                 caps.terminal_name = 'Command Prompt'
+            return
         
         # macOS-specific detection
-        elif caps.is_macos:
+        if caps.is_macos:
             if 'iterm' in term_program:
                 caps.terminal_type = TerminalType.ITERM2
                 caps.terminal_name = 'iTerm2'
-                caps.terminal_version = term_program_version
-            elif 'apple_terminal' in term_program:
+                caps.terminal_version = env.get('TERM_PROGRAM_VERSION', '')
+                return
+            if 'apple_terminal' in term_program:
                 caps.terminal_type = TerminalType.XTERM
                 caps.terminal_name = 'Terminal.app'
+                return
         
         # Linux/Unix detection
         else:
             if 'gnome' in term_program or 'gnome-terminal' in term_env:
                 caps.terminal_type = TerminalType.GNOME_TERMINAL
                 caps.terminal_name = 'GNOME Terminal'
-            elif 'konsole' in term_program or 'konsole' in term_env:
+                return
+            if 'konsole' in term_program or 'konsole' in term_env:
                 caps.terminal_type = TerminalType.KONSOLE
                 caps.terminal_name = 'Konsole'
-            elif 'tmux' in term_env:
+                return
+            if 'tmux' in term_env:
                 caps.terminal_type = TerminalType.TMUX
                 caps.terminal_name = 'tmux'
-            elif 'screen' in term_env:
+                return
+            if 'screen' in term_env:
                 caps.terminal_type = TerminalType.SCREEN
                 caps.terminal_name = 'GNU Screen'
-        
-        # IDE/Editor detection
-        if os.environ.get('VSCODE_PID') or 'vscode' in term_program:
-            caps.terminal_type = TerminalType.VSCODE
-            caps.terminal_name = 'VS Code Terminal'
-        elif os.environ.get('PYCHARM_HOSTED'):
-            caps.terminal_type = TerminalType.PYCHARM
-            caps.terminal_name = 'PyCharm Terminal'
-        elif os.environ.get('JPY_PARENT_PID'):
-            caps.terminal_type = TerminalType.JUPYTER
-            caps.terminal_name = 'Jupyter Terminal'
+                return
         
         # Fallback to xterm if unknown
-        if caps.terminal_type == TerminalType.UNKNOWN and 'xterm' in term_env:
+        if 'xterm' in term_env:
             caps.terminal_type = TerminalType.XTERM
             caps.terminal_name = 'xterm'
     
@@ -301,31 +421,27 @@ class TerminalDetector:
         """Detect terminal size and display characteristics."""
         
         # Get terminal size
-        try:
-            size = shutil.get_terminal_size()
-            caps.width = size.columns
-            caps.height = size.lines
-        except:
-            caps.width = 80
-            caps.height = 24
-        
-        # Set maximum recommended dimensions for consciousness displays
-        caps.max_width = min(120, caps.width)
-        caps.max_height = min(50, caps.height)
+        _apply_terminal_size(caps)
         
         # Basic capability detection
         caps.supports_cursor_movement = True  # Most terminals support this
         caps.supports_clear_screen = True     # Most terminals support this
         
         # Alternate buffer support (for full-screen applications)
-        if caps.terminal_type in [TerminalType.XTERM, TerminalType.TMUX, 
-                                 TerminalType.GNOME_TERMINAL, TerminalType.KONSOLE,
-                                 TerminalType.ITERM2]:
+        if caps.terminal_type in _ALTERNATE_BUFFER_TERMINALS:
             caps.supports_alternate_buffer = True
     
     def _detect_color_support(self, caps: TerminalCapabilities) -> None:
         """Detect terminal color capabilities."""
         
+        # Known terminals need no environment inspection
+        known = _KNOWN_COLOR_SUPPORT.get(caps.terminal_type)
+        if known is not None:
+            caps.color_support = known
+            caps.supports_color = True
+            caps.supports_rgb_color = known == ColorSupport.TRUE_COLOR
+            return
+        
         # Check COLORTERM environment variable
         colorterm = os.environ.get('COLORTERM', '').lower()
         if 'truecolor' in colorterm or '24bit' in colorterm:
@@ -343,36 +459,22 @@ class TerminalDetector:
         elif 'color' in term:
             caps.color_support = ColorSupport.EXTENDED_16
             caps.supports_color = True
-        elif term in ['xterm', 'screen', 'tmux']:
+        elif term in _BASIC_COLOR_TERMS:
             caps.color_support = ColorSupport.BASIC_8
             caps.supports_color = True
         
         # Windows-specific color detection
         if caps.is_windows:
-            try:
-                # Try to enable ANSI escape sequences on Windows
-                import ctypes
-                from ctypes import wintypes
-                
-                kernel32 = ctypes.windll.kernel32
-                handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
-                
-                # Get current console mode
-                mode = wintypes.DWORD()
-                kernel32.GetConsoleMode(handle, ctypes.byref(mode))
-                
-                # Enable virtual terminal processing
-                ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
-                new_mode = mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING
-                
-                if kernel32.SetConsoleMode(handle, new_mode):
-                    caps.supports_color = True
-                    if caps.terminal_type == TerminalType.WINDOWS_TERMINAL:
-                        caps.color_support = ColorSupport.TRUE_COLOR
-                        caps.supports_rgb_color = True
-                    else:
-                        caps.color_support = ColorSupport.EXTENDED_16
-            except:
+            # Try to enable ANSI escape sequences on Windows
+            vt_enabled = _enable_windows_vt_processing()
+            if vt_enabled:
+                caps.supports_color = True
+                if caps.terminal_type == TerminalType.WINDOWS_TERMINAL:
+                    caps.color_support = ColorSupport.TRUE_COLOR
+                    caps.supports_rgb_color = True
+                else:
+                    caps.color_support = ColorSupport.EXTENDED_16
+            elif vt_enabled is None:
                 # Fallback for older Windows or if ctypes fails
                 if caps.terminal_type == TerminalType.WINDOWS_TERMINAL:
                     caps.supports_color = True
@@ -381,14 +483,9 @@ class TerminalDetector:
     def _detect_unicode_support(self, caps: TerminalCapabilities) -> None:
         """Detect Unicode and special character support."""
         
-        # Check locale settings
-        import locale
-        try:
-            locale_name = locale.getlocale()[1] or locale.getdefaultlocale()[1]
-            if locale_name and 'utf' in locale_name.lower():
-                caps.supports_unicode = True
-        except:
-            pass
+        # Check the encoding output is actually written in
+        encoding = getattr(sys.stdout, 'encoding', None) or sys.getdefaultencoding()
+        caps.supports_unicode = 'utf' in encoding.lower()
         
         # Platform-specific Unicode detection
         if caps.is_macos or caps.is_linux:
@@ -402,47 +499,33 @@ class TerminalDetector:
             # CMD has limited Unicode support
         
         # Terminal-specific overrides
-        if caps.terminal_type in [TerminalType.ITERM2, TerminalType.GNOME_TERMINAL, 
-                                 TerminalType.KONSOLE, TerminalType.VSCODE]:
+        if caps.terminal_type in _UNICODE_TERMINALS:
             caps.supports_unicode = True
-        
-        # Test Unicode support with a simple character
-        if caps.supports_unicode:
-            try:
-                # Test if we can encode/decode Unicode
-                test_char = '◆'
-                test_char.encode('utf-8').decode('utf-8')
-            except:
-                caps.supports_unicode = False
     
     def _detect_advanced_features(self, caps: TerminalCapabilities) -> None:
         """Detect advanced terminal features."""
         
         # Mouse support detection
-        if caps.terminal_type in [TerminalType.XTERM, TerminalType.TMUX, 
-                                 TerminalType.GNOME_TERMINAL, TerminalType.KONSOLE,
-                                 TerminalType.ITERM2]:
+        if caps.terminal_type in _MOUSE_TERMINALS:
             caps.supports_mouse = True
         
         # Bracketed paste mode
-        if caps.terminal_type in [TerminalType.XTERM, TerminalType.GNOME_TERMINAL, 
-                                 TerminalType.KONSOLE, TerminalType.ITERM2]:
+        if caps.terminal_type in _BRACKETED_PASTE_TERMINALS:
             caps.supports_bracketed_paste = True
         
         # Focus events
-        if caps.terminal_type in [TerminalType.ITERM2, TerminalType.GNOME_TERMINAL]:
+        if caps.terminal_type in _FOCUS_EVENT_TERMINALS:
             caps.supports_focus_events = True
         
         # Hyperlink support
-        if caps.terminal_type in [TerminalType.ITERM2, TerminalType.GNOME_TERMINAL,
-                                 TerminalType.WINDOWS_TERMINAL, TerminalType.VSCODE]:
+        if caps.terminal_type in _HYPERLINK_TERMINALS:
             caps.supports_hyperlinks = True
         
         # Performance characteristics
-        if caps.terminal_type in [TerminalType.ITERM2, TerminalType.WINDOWS_TERMINAL]:
+        if caps.terminal_type in _FASTEST_TERMINALS:
             caps.supports_fast_updates = True
             caps.recommended_fps = 10
-        elif caps.terminal_type in [TerminalType.GNOME_TERMINAL, TerminalType.KONSOLE]:
+        elif caps.terminal_type in _FAST_TERMINALS:
             caps.supports_fast_updates = True
             caps.recommended_fps = 8
         else:
@@ -451,21 +534,15 @@ class TerminalDetector:
     def _apply_consciousness_optimizations(self, caps: TerminalCapabilities) -> None:
         """Apply consciousness-aware optimizations based on detected capabilities."""
         
-        terminal_key = caps.terminal_type.value
-        
         # Apply known optimizations from database
-        if terminal_key in TERMINAL_CAPABILITIES_DB:
-            db_caps = TERMINAL_CAPABILITIES_DB[terminal_key]
-            
-            for key, value in db_caps.items():
-                if hasattr(caps, key):
-                    setattr(caps, key, value)
+        for key, value in _TERMINAL_DB_OVERRIDES.get(caps.terminal_type, ()):
+            setattr(caps, key, value)
         
         # Consciousness-specific feature detection
         if caps.supports_unicode and caps.supports_color:
             caps.supports_sacred_geometry = True
         
-        if caps.color_support in [ColorSupport.COLOR_256, ColorSupport.TRUE_COLOR]:
+        if caps.color_support in _RICH_COLOR_SUPPORT:
             caps.biofield_visualization_quality = 'enhanced'
         
         if (caps.supports_rgb_color and caps.supports_unicode and 
@@ -477,7 +554,7 @@ class TerminalDetector:
             caps.supports_animations = True
         
         # Meditation optimization for certain terminals
-        if caps.terminal_type in [TerminalType.ITERM2, TerminalType.VSCODE]:
+        if caps.terminal_type in _MEDITATION_TERMINALS:
             caps.optimal_for_meditation = True
         
         # Adjust for low-capability terminals
@@ -494,23 +571,7 @@ class TerminalDetector:
         Returns:
             Dictionary of optimal settings for consciousness visualization
         """
-        caps = self.detect_capabilities()
-        
-        settings = {
-            'use_color': caps.supports_color,
-            'use_unicode': caps.supports_unicode,
-            'use_animations': caps.supports_animations,
-            'fps': caps.recommended_fps,
-            'max_width': caps.max_width,
-            'max_height': caps.max_height,
-            'biofield_quality': caps.biofield_visualization_quality,
-            'sacred_geometry': caps.supports_sacred_geometry,
-            'meditation_optimized': caps.optimal_for_meditation,
-            'color_depth': caps.color_support.value if caps.supports_color else 0,
-            'rgb_color': caps.supports_rgb_color
-        }
-        
-        return settings
+        return _display_settings(self.detect_capabilities())
     
     def get_fallback_recommendations(self) -> List[str]:
         """Get recommendations for improving terminal capabilities."""
@@ -552,45 +613,73 @@ class TerminalDetector:
         """Generate a detailed capability report for debugging."""
         
         caps = self.detect_capabilities()
-        
-        report_lines = [
-            "🧠 Neural Entrainment Terminal Capability Report",
-            "=" * 50,
-            f"Terminal: {caps.terminal_name} ({caps.terminal_type.value})",
-            f"Version: {caps.terminal_version}",
-            f"OS: {caps.os_type}",
-            f"Size: {caps.width}x{caps.height}",
-            "",
-            "Basic Capabilities:",
-            f"  Color Support: {'✓' if caps.supports_color else '✗'} ({caps.color_support.name})",
-            f"  Unicode Support: {'✓' if caps.supports_unicode else '✗'}",
-            f"  Cursor Movement: {'✓' if caps.supports_cursor_movement else '✗'}",
-            f"  Clear Screen: {'✓' if caps.supports_clear_screen else '✗'}",
-            "",
-            "Advanced Features:",
-            f"  RGB Colors: {'✓' if caps.supports_rgb_color else '✗'}",
-            f"  Mouse Support: {'✓' if caps.supports_mouse else '✗'}",
-            f"  Hyperlinks: {'✓' if caps.supports_hyperlinks else '✗'}",
-            f"  Animations: {'✓' if caps.supports_animations else '✗'}",
-            "",
-            "Consciousness Features:",
-            f"  Sacred Geometry: {'✓' if caps.supports_sacred_geometry else '✗'}",
-            f"  Biofield Quality: {caps.biofield_visualization_quality}",
-            f"  Meditation Optimized: {'✓' if caps.optimal_for_meditation else '✗'}",
-            f"  Recommended FPS: {caps.recommended_fps}",
-        ]
-        
-        return "\n".join(report_lines)
+        mark = _REPORT_MARKS
+        
+        # Adjacent f-strings compile into a single string build
+        return (
+            "🧠 Neural Entrainment Terminal Capability Report\n"
+            f"{'=' * 50}\n"
+            f"Terminal: {caps.terminal_name} ({caps.terminal_type.value})\n"
+            f"Version: {caps.terminal_version}\n"
+            f"OS: {caps.os_type}\n"
+            f"Size: {caps.width}x{caps.height}\n"
+            "\n"
+            "Basic Capabilities:\n"
+            f"  Color Support: {mark[caps.supports_color]} ({caps.color_support.name})\n"
+            f"  Unicode Support: {mark[caps.supports_unicode]}\n"
+            f"  Cursor Movement: {mark[caps.supports_cursor_movement]}\n"
+            f"  Clear Screen: {mark[caps.supports_clear_screen]}\n"
+            "\n"
+            "Advanced Features:\n"
+            f"  RGB Colors: {mark[caps.supports_rgb_color]}\n"
+            f"  Mouse Support: {mark[caps.supports_mouse]}\n"
+            f"  Hyperlinks: {mark[caps.supports_hyperlinks]}\n"
+            f"  Animations: {mark[caps.supports_animations]}\n"
+            "\n"
+            "Consciousness Features:\n"
+            f"  Sacred Geometry: {mark[caps.supports_sacred_geometry]}\n"
+            f"  Biofield Quality: {caps.biofield_visualization_quality}\n"
+            f"  Meditation Optimized: {mark[caps.optimal_for_meditation]}\n"
+            f"  Recommended FPS: {caps.recommended_fps}"
+        )
+
+def _display_settings(caps: TerminalCapabilities) -> Dict[str, Any]:
+    """Map a capability profile onto consciousness display settings."""
+    
+    return {
+        'use_color': caps.supports_color,
+        'use_unicode': caps.supports_unicode,
+        'use_animations': caps.supports_animations,
+        'fps': caps.recommended_fps,
+        'max_width': caps.max_width,
+        'max_height': caps.max_height,
+        'biofield_quality': caps.biofield_visualization_quality,
+        'sacred_geometry': caps.supports_sacred_geometry,
+        'meditation_optimized': caps.optimal_for_meditation,
+        'color_depth': caps.color_support.value if caps.supports_color else 0,
+        'rgb_color': caps.supports_rgb_color
+    }
+
+def _detect_once() -> TerminalCapabilities:
+    """Shared capability profile, detected on first use; a forced re-detect replaces it."""
+    
+    caps = TerminalDetector._shared_capabilities
+    if caps is None:
+        return TerminalDetector().detect_capabilities()
+    
+    # Everything else is fixed for the process, but the window can be resized
+    _apply_terminal_size(caps)
+    return caps
 
 def detect_terminal_capabilities() -> TerminalCapabilities:
     """
     Convenience function to detect terminal capabilities.
     
     Returns:
-        Terminal capabilities object
+        Terminal capabilities object, shared process-wide (do not mutate); its
+        size fields are refreshed from the current terminal size on each call
     """
-    detector = TerminalDetector()
-    return detector.detect_capabilities()
+    return _detect_once()
 
 def get_optimal_consciousness_settings() -> Dict[str, Any]:
     """
@@ -599,5 +688,4 @@ def get_optimal_consciousness_settings() -> Dict[str, Any]:
     Returns:
         Dictionary of optimal display settings
     """
-    detector = TerminalDetector()
-    return detector.get_optimal_display_settings()
\ No newline at end of file
+    return _display_settings(_detect_once())
\ No newline at end of file
@@ -12,7 +12,11 @@ work across all environments while preserving sacred geometry meaning.
 """
 
 import sys
-from typing import Dict, Any, List, Optional, Tuple, Union
+import math
+import unicodedata
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
@@ -161,6 +165,137 @@ BOX_DRAWING_MAP = {
 # Combine all mappings
 ALL_SYMBOL_MAPPINGS = {**CONSCIOUSNESS_SYMBOL_MAP, **BOX_DRAWING_MAP}
 
+# Fallback chain (minimal -> basic -> extended -> symbol) resolved once per level
+_RESOLVED_FALLBACKS: Dict[FallbackLevel, Dict[str, str]] = {
+    FallbackLevel.FULL_UNICODE: {
+        symbol: symbol for symbol in ALL_SYMBOL_MAPPINGS
+    },
+    FallbackLevel.EXTENDED_ASCII: {
+        symbol: mapping.get('extended', symbol)
+        for symbol, mapping in ALL_SYMBOL_MAPPINGS.items()
+    },
+    FallbackLevel.BASIC_ASCII: {
+        symbol: mapping.get('basic', mapping.get('extended', symbol))
+        for symbol, mapping in ALL_SYMBOL_MAPPINGS.items()
+    },
+    FallbackLevel.MINIMAL: {
+        symbol: mapping.get('minimal', mapping.get('basic', mapping.get('extended', symbol)))
+        for symbol, mapping in ALL_SYMBOL_MAPPINGS.items()
+    }
+}
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SACRED GEOMETRY PATTERN ROWS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# Pattern geometry depends only on size, so rows are built once in Unicode and
+# converted to the active fallback level with a single translate per row
+_MANDALA_SYMBOLS = ('◉', '●', '◆', '○', '·', ' ')
+_SPIRAL_SYMBOLS = ('◆', '◇', ' ')
+_FLOWER_OF_LIFE_SYMBOLS = ('○', ' ')
+_FLOWER_OF_LIFE_CENTERS = ((0, 0), (1, 0), (-1, 0), (0.5, 0.866), (-0.5, 0.866), (0.5, -0.866), (-0.5, -0.866))
+
+@lru_cache(maxsize=32)
+def _mandala_rows(size: int) -> Tuple[str, ...]:
+    """Unconverted mandala rows for a radius."""
+    
+    rows = []
+    for y in range(-size, size + 1):
+        # Rows start blank; only cells inside the mandala are written
+        row = [' '] * (2 * size + 1)
+        for x in range(-size, size + 1):
+            distance = (x * x + y * y) ** 0.5
+            
+            if distance > size:
+                continue
+            
+            if distance < 1:
+                symbol = '◉'  # Center
+            elif distance < size * 0.3:
+                symbol = '●'  # Inner circle
+            elif distance < size * 0.6:
+                symbol = '◆'  # Middle ring
+            elif distance < size * 0.9:
+                symbol = '○'  # Outer ring
+            else:
+                symbol = '·'  # Edge
+            
+            row[x + size] = symbol
+        rows.append(''.join(row))
+    
+    return tuple(rows)
+
+@lru_cache(maxsize=32)
+def _spiral_rows(size: int) -> Tuple[str, ...]:
+    """Unconverted golden spiral rows for a radius."""
+    
+    rows = []
+    for y in range(-size, size + 1):
+        # Rows start blank; only cells on the spiral arm are written
+        row = [' '] * (2 * size + 1)
+        for x in range(-size, size + 1):
+            distance = (x * x + y * y) ** 0.5
+            angle = math.atan2(y, x)
+            
+            # Golden spiral equation
+            spiral_value = distance - (size * angle / (2 * math.pi))
+            
+            if abs(spiral_value) < 1:
+                row[x + size] = '◆'
+            elif abs(spiral_value) < 2:
+                row[x + size] = '◇'
+        rows.append(''.join(row))
+    
+    return tuple(rows)
+
+@lru_cache(maxsize=32)
+def _flower_of_life_rows(size: int) -> Tuple[str, ...]:
+    """Unconverted Flower of Life rows for a radius."""
+    
+    rows = []
+    radius = size/2
+    scaled_centers = [(cx * size/2, cy * size/2) for cx, cy in _FLOWER_OF_LIFE_CENTERS]
+    
+    # Simplified Flower of Life using overlapping circles
+    for y in range(-size, size + 1):
+        # Vertical offsets are fixed for the whole row
+        row_centers = [(sx, (y - sy) ** 2) for sx, sy in scaled_centers]
+        
+        # Rows start blank; only cells on a circle are written
+        row = [' '] * (2 * size + 1)
+        for x in range(-size, size + 1):
+            # Check multiple circle centers for overlapping pattern
+            for sx, dy_squared in row_centers:
+                distance = ((x - sx) ** 2 + dy_squared) ** 0.5
+                if abs(distance - radius) < 0.5:
+                    row[x + size] = '○'
+                    break
+        rows.append(''.join(row))
+    
+    return tuple(rows)
+
+# Biofield wave glyphs by wave value: bisect_left over the ascending bounds
+# picks the glyph for the first strict threshold the value exceeds
+_WAVE_BOUNDS = (-0.3, 0.0, 0.3, 0.7)
+_WAVE_SYMBOLS = (' ', '·', '∙', '⌇', '∿')
+
+@lru_cache(maxsize=64)
+def _wave_sines(width: int) -> Tuple[float, ...]:
+    """Sine of each column's phase over two wave periods."""
+    return tuple(math.sin(i / width * 4 * math.pi) for i in range(width))
+
+def _convert_pattern_rows(rows: Tuple[str, ...], symbols: Iterable[str],
+                          convert_symbol: Callable[[str], str]) -> List[str]:
+    """Convert cached pattern rows with the given symbol converter."""
+    
+    table = {ord(symbol): convert_symbol(symbol) for symbol in symbols}
+    
+    # Full Unicode leaves every symbol unchanged, so only trailing blanks go
+    if all(chr(code) == converted for code, converted in table.items()):
+        return [row.rstrip() for row in rows]
+    
+    return [row.translate(table).rstrip() for row in rows]
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # UNICODE FALLBACK MANAGER CLASS
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -174,6 +309,38 @@ class FallbackSettings:
     maintain_alignment: bool = True
     consciousness_aware: bool = True
 
+# Terminal probes depend only on the stdout encoding, so results are shared by
+# every manager in the process
+_UNICODE_SUPPORT_CACHE: Dict[Optional[str], bool] = {}
+_CHAR_DISPLAY_CACHE: Dict[Tuple[str, str], bool] = {}
+
+# ASCII substitutes for unmapped characters, by Unicode major category
+_CATEGORY_SUBSTITUTES = {
+    'P': '.',  # Punctuation
+    'S': '*',  # Symbols
+    'M': '~',  # Marks
+    'N': '#'   # Numbers
+}
+_SUBSTITUTE_CACHE: Dict[str, str] = {}
+
+class _FallbackTable(dict):
+    """
+    str.translate table that resolves unmapped characters on first use.
+    
+    Symbol fallbacks are filled in up front; any other code point is passed
+    to the resolver once and the result is kept for later lookups.
+    """
+    
+    __slots__ = ('_resolve',)
+    
+    def __init__(self, mapping: Dict[int, str], resolve):
+        super().__init__(mapping)
+        self._resolve = resolve
+    
+    def __missing__(self, codepoint: int) -> str:
+        value = self[codepoint] = self._resolve(chr(codepoint))
+        return value
+
 class UnicodeFallbackManager:
     """
     Intelligent Unicode fallback management for consciousness visualization.
@@ -186,8 +353,7 @@ class UnicodeFallbackManager:
     def __init__(self, fallback_level: FallbackLevel = FallbackLevel.BASIC_ASCII):
         self.fallback_level = fallback_level
         self.settings = FallbackSettings(fallback_level=fallback_level)
-        self.encoding_cache = {}
-        self.test_cache = {}
+        self._translation_tables = {}
     
     def can_display_unicode(self) -> bool:
         """
@@ -196,32 +362,23 @@ class UnicodeFallbackManager:
         Returns:
             True if Unicode is supported
         """
-        if 'unicode_support' in self.test_cache:
-            return self.test_cache['unicode_support']
+        stdout_encoding = getattr(sys.stdout, 'encoding', None)
+        cached = _UNICODE_SUPPORT_CACHE.get(stdout_encoding)
+        if cached is not None:
+            return cached
         
+        # Probe the encoding in memory; writing to the terminal would leave a
+        # stray character on screen
         try:
-            # Test encoding capabilities
             test_chars = ['◆', '∿', '🧠']
             for char in test_chars:
-                char.encode(sys.stdout.encoding or 'utf-8')
-            
-            # Test if we can write Unicode to stdout
-            original_stdout = sys.stdout.write
-            test_successful = True
-            
-            try:
-                # Try to write a test Unicode character
-                sys.stdout.write('◆')
-                sys.stdout.flush()
-            except (UnicodeEncodeError, UnicodeDecodeError):
-                test_successful = False
-            
-            self.test_cache['unicode_support'] = test_successful
-            return test_successful
-            
-        except Exception:
-            self.test_cache['unicode_support'] = False
-            return False
+                char.encode(stdout_encoding or 'utf-8')
+            supported = True
+        except (UnicodeError, LookupError):
+            supported = False
+        
+        _UNICODE_SUPPORT_CACHE[stdout_encoding] = supported
+        return supported
     
     def determine_optimal_fallback_level(self) -> FallbackLevel:
         """
@@ -257,7 +414,13 @@ class UnicodeFallbackManager:
         Returns:
             Fallback representation of the symbol
         """
-        if symbol not in ALL_SYMBOL_MAPPINGS:
+        # ASCII needs no fallback, and full Unicode maps every symbol to itself
+        if symbol.isascii() or self.fallback_level == FallbackLevel.FULL_UNICODE:
+            return symbol
+        
+        fallback = _RESOLVED_FALLBACKS[self.fallback_level].get(symbol)
+        
+        if fallback is None:
             # If no mapping exists, try to handle gracefully
             if self.fallback_level == FallbackLevel.FULL_UNICODE:
                 return symbol
@@ -265,19 +428,6 @@ class UnicodeFallbackManager:
                 # Find a reasonable ASCII substitute
                 return self._find_ascii_substitute(symbol)
         
-        mapping = ALL_SYMBOL_MAPPINGS[symbol]
-        
-        if self.fallback_level == FallbackLevel.FULL_UNICODE:
-            return symbol
-        elif self.fallback_level == FallbackLevel.EXTENDED_ASCII:
-            fallback = mapping.get('extended', symbol)
-        elif self.fallback_level == FallbackLevel.BASIC_ASCII:
-            fallback = mapping.get('basic', mapping.get('extended', symbol))
-        else:  # MINIMAL
-            fallback = mapping.get('minimal', 
-                                 mapping.get('basic', 
-                                           mapping.get('extended', symbol)))
-        
         # Length preservation
         if preserve_length and len(fallback) != len(symbol):
             if len(fallback) < len(symbol):
@@ -300,34 +450,49 @@ class UnicodeFallbackManager:
         Returns:
             Text with Unicode symbols converted to fallbacks
         """
+        # Plain ASCII passes through unchanged (a C-level scan)
+        if text.isascii():
+            return text
+        
         if self.fallback_level == FallbackLevel.FULL_UNICODE and self.can_display_unicode():
             return text
         
-        result = ""
-        i = 0
-        original_length = len(text)
-        
-        while i < len(text):
-            char = text[i]
-            
-            if char in ALL_SYMBOL_MAPPINGS:
-                fallback = self.convert_symbol(char, preserve_length=preserve_spacing)
-                result += fallback
-            else:
-                # Check if character can be displayed
-                if self._can_display_char(char):
-                    result += char
-                else:
-                    result += self._find_ascii_substitute(char)
-            
-            i += 1
+        # Substitution runs in a single C-level pass over the text
+        result = text.translate(self._get_translation_table(preserve_spacing))
         
         # Ensure alignment is preserved if requested
         if preserve_spacing and self.settings.maintain_alignment:
-            result = self._adjust_alignment(text, result, original_length)
+            result = self._adjust_alignment(text, result, len(text))
         
         return result
     
+    def _get_translation_table(self, preserve_length: bool) -> _FallbackTable:
+        """Get the str.translate table for the current fallback level."""
+        
+        # Keyed on the level too, since callers may change fallback_level later
+        key = (self.fallback_level, preserve_length)
+        table = self._translation_tables.get(key)
+        
+        if table is None:
+            # Multi-codepoint symbols (emoji with variation selectors) never
+            # match a single character, so only single characters are mapped
+            table = _FallbackTable(
+                {ord(symbol): self.convert_symbol(symbol, preserve_length=preserve_length)
+                 for symbol in ALL_SYMBOL_MAPPINGS if len(symbol) == 1},
+                self._convert_unmapped_char
+            )
+            self._translation_tables[key] = table
+        
+        return table
+    
+    def _convert_unmapped_char(self, char: str) -> str:
+        """Convert a character that has no symbol mapping."""
+        
+        # Check if character can be displayed
+        if self._can_display_char(char):
+            return char
+        return self._find_ascii_substitute(char)
+    
     def convert_consciousness_display(self, display_lines: List[str]) -> List[str]:
         """
         Convert consciousness display with intelligent layout preservation.
@@ -339,13 +504,23 @@ class UnicodeFallbackManager:
             Converted display lines with fallbacks
         """
         converted_lines = []
-        max_original_width = max(len(line) for line in display_lines) if display_lines else 0
+        max_original_width = max(map(len, display_lines)) if display_lines else 0
+        
+        # One table serves every line; None when the terminal shows Unicode as is
+        if self.fallback_level == FallbackLevel.FULL_UNICODE and self.can_display_unicode():
+            table = None
+        else:
+            table = self._get_translation_table(True)
         
         for line in display_lines:
-            converted_line = self.convert_text(line, preserve_spacing=True)
+            if table is None or line.isascii():
+                converted_line = line
+            else:
+                converted_line = line.translate(table)
             
-            # Ensure sacred geometry structures remain aligned
-            if self.settings.consciousness_aware:
+            # Length-preserving fallbacks keep structures aligned, so re-centering
+            # is only needed if a line's length changed
+            if self.settings.consciousness_aware and len(converted_line) != len(line):
                 converted_line = self._preserve_sacred_geometry_alignment(line, converted_line)
             
             converted_lines.append(converted_line)
@@ -389,83 +564,53 @@ class UnicodeFallbackManager:
         Returns:
             List of strings representing the mandala
         """
-        lines = []
-        
-        for y in range(-size, size + 1):
-            line = ""
-            for x in range(-size, size + 1):
-                distance = (x * x + y * y) ** 0.5
-                
-                if distance <= size:
-                    if distance < 1:
-                        symbol = '◉'  # Center
-                    elif distance < size * 0.3:
-                        symbol = '●'  # Inner circle
-                    elif distance < size * 0.6:
-                        symbol = '◆'  # Middle ring
-                    elif distance < size * 0.9:
-                        symbol = '○'  # Outer ring
-                    else:
-                        symbol = '·'  # Edge
-                else:
-                    symbol = ' '
-                
-                line += self.convert_symbol(symbol)
-            
-            lines.append(line.rstrip())
-        
-        return lines
+        return _convert_pattern_rows(_mandala_rows(size), _MANDALA_SYMBOLS, self.convert_symbol)
     
     def _can_display_char(self, char: str) -> bool:
         """Test if a specific character can be displayed."""
         
-        if char in self.encoding_cache:
-            return self.encoding_cache[char]
+        # ASCII displays under any stdout encoding
+        if char < '\x80':
+            return True
+        
+        encoding = sys.stdout.encoding or 'ascii'
+        key = (encoding, char)
+        cached = _CHAR_DISPLAY_CACHE.get(key)
+        if cached is not None:
+            return cached
         
         try:
-            encoding = sys.stdout.encoding or 'ascii'
             char.encode(encoding)
-            self.encoding_cache[char] = True
-            return True
+            displayable = True
         except (UnicodeEncodeError, UnicodeDecodeError):
-            self.encoding_cache[char] = False
-            return False
+            displayable = False
+        
+        _CHAR_DISPLAY_CACHE[key] = displayable
+        return displayable
     
     def _find_ascii_substitute(self, char: str) -> str:
         """Find a reasonable ASCII substitute for an unknown character."""
         
+        substitute = _SUBSTITUTE_CACHE.get(char)
+        if substitute is not None:
+            return substitute
+        
         # Get character category and find appropriate substitute
         try:
-            import unicodedata
             category = unicodedata.category(char)
-            
-            if category.startswith('P'):  # Punctuation
-                return '.'
-            elif category.startswith('S'):  # Symbols
-                return '*'
-            elif category.startswith('M'):  # Marks
-                return '~'
-            elif category.startswith('N'):  # Numbers
-                return '#'
-            else:
-                return '?'
-        except:
+        except (TypeError, ValueError):
+            # Not a single character
             return '?'
+        
+        substitute = _CATEGORY_SUBSTITUTES.get(category[0], '?')
+        _SUBSTITUTE_CACHE[char] = substitute
+        return substitute
     
     def _adjust_alignment(self, original: str, converted: str, target_length: int) -> str:
         """Adjust converted string to maintain alignment."""
         
-        current_length = len(converted)
-        
-        if current_length == target_length:
-            return converted
-        elif current_length < target_length:
-            # Pad with spaces
-            padding = target_length - current_length
-            return converted + ' ' * padding
-        else:
-            # Truncate carefully, preserving important symbols
-            return converted[:target_length]
+        # Pad with spaces, or truncate when too long
+        return converted.ljust(target_length)[:target_length]
     
     def _preserve_sacred_geometry_alignment(self, original: str, converted: str) -> str:
         """Preserve sacred geometry alignment in converted text."""
@@ -478,31 +623,21 @@ class UnicodeFallbackManager:
             # Re-center if necessary
             target_length = len(original)
             if len(converted) < target_length:
-                padding_total = target_length - len(converted)
-                left_padding = padding_total // 2
-                right_padding = padding_total - left_padding
-                return ' ' * left_padding + converted + ' ' * right_padding
+                # An odd padding space goes on the right (str.center may put it left)
+                left_padding = (target_length - len(converted)) // 2
+                return (' ' * left_padding + converted).ljust(target_length)
         
         return converted
     
     def _align_consciousness_display(self, lines: List[str], target_width: int) -> List[str]:
         """Align consciousness display lines for visual consistency."""
         
-        aligned_lines = []
-        
-        for line in lines:
-            if len(line) < target_width:
-                # Center-align consciousness displays
-                padding = target_width - len(line)
-                left_padding = padding // 2
-                right_padding = padding - left_padding
-                aligned_line = ' ' * left_padding + line + ' ' * right_padding
-            else:
-                aligned_line = line[:target_width]
-            
-            aligned_lines.append(aligned_line)
-        
-        return aligned_lines
+        # Center-align consciousness displays, an odd padding space going on the right
+        return [
+            (' ' * ((target_width - len(line)) // 2) + line).ljust(target_width)
+            if len(line) < target_width else line[:target_width]
+            for line in lines
+        ]
     
     def get_fallback_summary(self) -> Dict[str, Any]:
         """Get summary of current fallback configuration."""
@@ -524,6 +659,30 @@ class UnicodeFallbackManager:
 # CONSCIOUSNESS SYMBOL MAPPER CLASS
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+# Symbols representing each consciousness state
+CONSCIOUSNESS_STATE_SYMBOLS = {
+    'deep_delta': '●',
+    'delta': '◉',
+    'theta': '◆',
+    'alpha': '△',
+    'beta': '□',
+    'gamma': '✦',
+    'neutral': '○',
+    'integration': '∞',
+    'transcendent': '🌟'
+}
+
+# Symbols representing each biofield type
+BIOFIELD_TYPE_SYMBOLS = {
+    'schumann': '🌍',
+    'solfeggio': '♫',
+    'golden_ratio': 'Φ',
+    'natural_frequency': '🌿',
+    'coherence': '∿',
+    'harmony': '≈',
+    'resonance': '∞'
+}
+
 class ConsciousnessSymbolMapper:
     """
     Specialized symbol mapper for consciousness-aware applications.
@@ -547,19 +706,7 @@ class ConsciousnessSymbolMapper:
         Returns:
             Symbol representing the consciousness state
         """
-        state_symbols = {
-            'deep_delta': '●',
-            'delta': '◉',
-            'theta': '◆',
-            'alpha': '△',
-            'beta': '□',
-            'gamma': '✦',
-            'neutral': '○',
-            'integration': '∞',
-            'transcendent': '🌟'
-        }
-        
-        symbol = state_symbols.get(consciousness_state, '○')
+        symbol = CONSCIOUSNESS_STATE_SYMBOLS.get(consciousness_state, '○')
         return self.fallback_manager.convert_symbol(symbol)
     
     def map_biofield_symbol(self, biofield_type: str) -> str:
@@ -572,17 +719,7 @@ class ConsciousnessSymbolMapper:
         Returns:
             Symbol representing the biofield type
         """
-        biofield_symbols = {
-            'schumann': '🌍',
-            'solfeggio': '♫',
-            'golden_ratio': 'Φ',
-            'natural_frequency': '🌿',
-            'coherence': '∿',
-            'harmony': '≈',
-            'resonance': '∞'
-        }
-        
-        symbol = biofield_symbols.get(biofield_type, '∿')
+        symbol = BIOFIELD_TYPE_SYMBOLS.get(biofield_type, '∿')
         return self.fallback_manager.convert_symbol(symbol)
     
     def create_consciousness_progress_bar(self, progress: float, width: int,
@@ -630,27 +767,12 @@ class ConsciousnessSymbolMapper:
         Returns:
             Wave pattern string
         """
-        import math
+        glyphs = tuple(map(self.fallback_manager.convert_symbol, _WAVE_SYMBOLS))
         
-        pattern = ""
-        for i in range(width):
-            x = i / width * 4 * math.pi
-            wave_value = math.sin(x) * coherence
-            
-            if wave_value > 0.7:
-                symbol = '∿'
-            elif wave_value > 0.3:
-                symbol = '⌇'
-            elif wave_value > 0.0:
-                symbol = '∙'
-            elif wave_value > -0.3:
-                symbol = '·'
-            else:
-                symbol = ' '
-            
-            pattern += self.fallback_manager.convert_symbol(symbol)
-        
-        return pattern
+        return ''.join([
+            glyphs[bisect_left(_WAVE_BOUNDS, sine * coherence)]
+            for sine in _wave_sines(width)
+        ])
     
     def create_sacred_geometry_pattern(self, pattern_type: str, size: int) -> List[str]:
         """
@@ -675,58 +797,14 @@ class ConsciousnessSymbolMapper:
     def _create_spiral_pattern(self, size: int) -> List[str]:
         """Create a spiral pattern with fallback symbols."""
         
-        lines = []
-        import math
-        
-        for y in range(-size, size + 1):
-            line = ""
-            for x in range(-size, size + 1):
-                distance = (x * x + y * y) ** 0.5
-                angle = math.atan2(y, x)
-                
-                # Golden spiral equation
-                spiral_value = distance - (size * angle / (2 * math.pi))
-                
-                if abs(spiral_value) < 1:
-                    symbol = '◆'
-                elif abs(spiral_value) < 2:
-                    symbol = '◇'
-                else:
-                    symbol = ' '
-                
-                line += self.fallback_manager.convert_symbol(symbol)
-            
-            lines.append(line.rstrip())
-        
-        return lines
+        return _convert_pattern_rows(_spiral_rows(size), _SPIRAL_SYMBOLS,
+                                     self.fallback_manager.convert_symbol)
     
     def _create_flower_of_life_pattern(self, size: int) -> List[str]:
         """Create a Flower of Life pattern with fallback symbols."""
         
-        lines = []
-        import math
-        
-        # Simplified Flower of Life using overlapping circles
-        for y in range(-size, size + 1):
-            line = ""
-            for x in range(-size, size + 1):
-                # Check multiple circle centers for overlapping pattern
-                on_pattern = False
-                
-                centers = [(0, 0), (1, 0), (-1, 0), (0.5, 0.866), (-0.5, 0.866), (0.5, -0.866), (-0.5, -0.866)]
-                
-                for cx, cy in centers:
-                    distance = ((x - cx * size/2) ** 2 + (y - cy * size/2) ** 2) ** 0.5
-                    if abs(distance - size/2) < 0.5:
-                        on_pattern = True
-                        break
-                
-                symbol = '○' if on_pattern else ' '
-                line += self.fallback_manager.convert_symbol(symbol)
-            
-            lines.append(line.rstrip())
-        
-        return lines
+        return _convert_pattern_rows(_flower_of_life_rows(size), _FLOWER_OF_LIFE_SYMBOLS,
+                                     self.fallback_manager.convert_symbol)
 
 def create_fallback_manager(auto_detect: bool = True) -> UnicodeFallbackManager:
     """
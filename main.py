@@ -29,6 +29,14 @@ from moviepy.editor import ImageSequenceClip  # Enhanced for animations
 from rich.progress import Progress
 from rich.prompt import Confirm, Prompt
 
+try:
+    # jsonschema >= 4.18 resolves $ref through referencing registries
+    from referencing import Registry, Resource
+    from referencing.jsonschema import specification_with
+    REFERENCING_AVAILABLE = True
+except ImportError:
+    REFERENCING_AVAILABLE = False
+
 # System modules - assume src/ in sys.path or adjust
 import sys
 sys.path.append(str(Path(__file__).parent / "src"))
@@ -71,37 +79,68 @@ def register_hook(hook_name: str, func: callable):
         HOOKS[hook_name].append(func)
 
 @lru_cache(maxsize=5)
-def load_json_cached(file_path: str) -> Dict:
-    """Cached loader with validation."""
+def _load_json_version(file_path: str, mtime: float) -> Dict:
+    """Parse one version of a JSON file; the mtime key drops stale entries after edits."""
     path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Config not found: {path}")
     with path.open("r") as f:
         data = json.load(f)
     logger.info("Loaded config", file=str(path))
     return data
 
-def deep_merge(dict1: Dict, dict2: Dict) -> Dict:
-    """Recursive merge, dict2 overrides."""
-    result = dict1.copy()
+def load_json_cached(file_path: str) -> Dict:
+    """Cached loader with validation."""
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Config not found: {path}")
+    return _load_json_version(file_path, path.stat().st_mtime)
+
+def deep_merge(dict1: Dict, dict2: Dict, *, inplace: bool = False) -> Dict:
+    """Recursive merge, dict2 overrides; inplace merges into dict1 instead of a copy."""
+    result = dict1 if inplace else dict1.copy()
     for key, value in dict2.items():
         if isinstance(value, dict) and key in result and isinstance(result[key], dict):
-            result[key] = deep_merge(result[key], value)
+            result[key] = deep_merge(result[key], value, inplace=inplace)
         else:
             result[key] = value
     return result
 
+# Compiled validators per schema key, dropped whenever SCHEMA_FILE changes
+_VALIDATORS: Dict[str, Any] = {}
+_VALIDATORS_MTIME: Optional[float] = None
+
+def _get_schema_validator(schema_key: str):
+    """Checked, compiled validator for a schema key; built once per schema file version."""
+    global _VALIDATORS_MTIME
+    mtime = SCHEMA_FILE.stat().st_mtime
+    if mtime != _VALIDATORS_MTIME:
+        _VALIDATORS.clear()
+        _VALIDATORS_MTIME = mtime
+    validator = _VALIDATORS.get(schema_key)
+    if validator is None:
+        document = load_json_cached(str(SCHEMA_FILE))
+        schema = document.get("schema_definitions", {}).get(schema_key)
+        if not schema:
+            raise ValueError(f"Schema not found: {schema_key}")
+        cls = jsonschema.validators.validator_for(schema)
+        cls.check_schema(schema)
+        # Refs like #/schema_definitions/phase_schema resolve against the whole file
+        base_uri = SCHEMA_FILE.resolve().as_uri()
+        if REFERENCING_AVAILABLE:
+            resource = Resource(contents=document, specification=specification_with(cls.META_SCHEMA["$schema"]))
+            registry = Registry().with_resource(base_uri, resource)
+            # Rooting at a $ref into the file gives the schema the file's base URI
+            validator = cls({"$ref": f"{base_uri}#/schema_definitions/{schema_key}"}, registry=registry)
+        else:
+            # RefResolver is deprecated since jsonschema 4.18; only older releases get here
+            resolver = jsonschema.RefResolver(base_uri=base_uri, referrer=document)
+            validator = cls(schema, resolver=resolver)
+        _VALIDATORS[schema_key] = validator
+    return validator
+
 def validate_config_against_schema(config: Dict, schema_key: str) -> List[str]:
     """Enhanced validation with jsonschema + cerberus for fixes."""
-    schemas = load_json_cached(str(SCHEMA_FILE)).get("schema_definitions", {})
-    schema = schemas.get(schema_key)
-    if not schema:
-        raise ValueError(f"Schema not found: {schema_key}")
-    try:
-        jsonschema.validate(instance=config, schema=schema)
-        return []
-    except jsonschema.exceptions.ValidationError as e:
-        return [f"Error at {e.json_path}: {e.message}"]
+    validator = _get_schema_validator(schema_key)
+    return [f"Error at {e.json_path}: {e.message}" for e in validator.iter_errors(config)]
 
 def suggest_fixes(errors: List[str], config: Dict) -> Dict:
     """Fuzzy auto-fixes using cerberus."""
@@ -223,6 +262,10 @@ async def build_session_async(adapted_config: Dict, out_dir: str, viz: bool, rep
     logger.info("Build complete", path=str(output_path), coherence=metadata.get("biofield_coherence", 0))
     return str(output_path)
 
+def _build_sync_wrapper(adapted_config: Dict, out_dir: str, viz: bool, report: bool, preview: bool) -> str:
+    """Process-pool entry point: runs the async build to completion in the worker."""
+    return asyncio.run(build_session_async(adapted_config, out_dir, viz, report, preview))
+
 @app.command()
 def build(
     preset: str = typer.Option(..., prompt=True, help="Preset name from presets.json"),
@@ -414,7 +457,7 @@ def manage(
         schemas = load_json_cached(str(SCHEMA_FILE))["schema_definitions"]
         new = {}  # Start empty
         if template:
-            new = deep_merge(new, data.get(key, {}).get(template, {}))
+            deep_merge(new, data.get(key, {}).get(template, {}), inplace=True)
         # Interactive edit
         for field in schemas.get(f"{resource}_schema", {}).get("properties", {}):
             val = questionary.text(f"{field} (type: {schemas[field]['type']}):").ask()
@@ -458,15 +501,16 @@ def batch(
     profile_list = [p.strip() for p in profiles.split(",")]
     combos = [(pt, pf) for pt in preset_list for pf in profile_list]
     
+    # Configs are loaded and adapted here once; workers only receive finished dicts
+    preset_configs = load_json_cached(str(PRESETS_FILE))["consciousness_aware_presets"]
+    profile_templates = load_json_cached(str(PROFILES_FILE))["neural_profile_templates"]
+    
     outputs = []
     with concurrent.futures.ProcessPoolExecutor(max_workers=parallel) as executor:
         futures = []
         for pt, pf in combos:
-            # Partial build func
-            futures.append(executor.submit(build_session_async, 
-                                           adapt_config_with_profile(load_json_cached(str(PRESETS_FILE))["consciousness_aware_presets"][pt], 
-                                                                     load_json_cached(str(PROFILES_FILE))["neural_profile_templates"][pf]),
-                                           out_dir, viz, report, False))
+            adapted = adapt_config_with_profile(preset_configs[pt], profile_templates[pf])
+            futures.append(executor.submit(_build_sync_wrapper, adapted, out_dir, viz, report, False))
         for future in concurrent.futures.as_completed(futures):
             try:
                 outputs.append(future.result())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# 🧠 Neural Entrainment System v2.0 - Real-time Updater Tests
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 🌟 Dr. KB Jama, Neural Dialogue Interface Research
+
+"""
+Real-time Updater Tests - Smooth transition evaluation.
+"""
+
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+# Importing the cli package pulls in the full CLI, so the updater module is loaded on its own
+_SPEC = importlib.util.spec_from_file_location(
+    'cli.utils.real_time_updater', Path(__file__).parent.parent / 'cli' / 'utils' / 'real_time_updater.py')
+real_time_updater = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(real_time_updater)
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SMOOTH TRANSITION TESTS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+@pytest.mark.parametrize('easing', ['linear', 'golden_ratio', 'ease_out', 'consciousness_flow'])
+def test_transition_read_before_start_time_holds_start_value(easing):
+    """A frame timestamp earlier than the transition's start reads as its start value."""
+    manager = real_time_updater.SmoothAnimationManager()
+    transition_id = manager.create_smooth_transition(0.2, 0.8, 2.0, easing=easing)
+    before_start = manager.active_transitions[transition_id]['start_time'] - 0.5
+    
+    value = manager.get_transition_value(transition_id, now=before_start)
+    
+    assert isinstance(value, float)
+    assert value == pytest.approx(0.2)
+
+def test_all_transition_values_before_start_time_hold_start_values():
+    """Dictionary transitions clamp the same way when read for a whole frame."""
+    manager = real_time_updater.SmoothAnimationManager()
+    transition_id = manager.create_smooth_transition({'coherence': 0.4}, {'coherence': 0.9}, 1.0,
+                                                     easing='golden_ratio')
+    before_start = manager.active_transitions[transition_id]['start_time'] - 0.25
+    
+    values = manager.get_all_transition_values(now=before_start)
+    
+    assert values[transition_id] == {'coherence': pytest.approx(0.4)}
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# FRAME DIFF RENDERING TESTS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _render(updater, lines, capsys):
+    """Render a full-screen frame and report whether it was a full redraw or a diff."""
+    updater._render_frame(real_time_updater.UpdateFrame(
+        content=lines, timestamp=0.0, frame_number=0, animation_phase=0.0, metadata={}))
+    output = capsys.readouterr().out
+    return 'full' if output.startswith(updater.clear_screen) else 'diff'
+
+def test_frames_with_wide_glyph_lines_are_redrawn_in_full(monkeypatch, capsys):
+    """Lines that wrap because of double-width glyphs cannot be diff-rendered."""
+    monkeypatch.setattr(real_time_updater.shutil, 'get_terminal_size',
+                        lambda *args, **kwargs: os.terminal_size((20, 10)))
+    updater = real_time_updater.RealTimeUpdater()
+    
+    assert _render(updater, ['header', 'a' * 12], capsys) == 'full'
+    assert _render(updater, ['header', 'b' * 12], capsys) == 'diff'
+    # Twelve brain glyphs fill 24 columns, wider than the 20-column terminal
+    assert _render(updater, ['header', '🧠' * 12], capsys) == 'full'
+    assert _render(updater, ['header', '中' * 9], capsys) == 'full'
+    assert _render(updater, ['header', '中' * 10], capsys) == 'diff'
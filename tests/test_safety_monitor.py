@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# 🧠 Neural Entrainment System v2.0 - Safety Monitor Tests
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 🌟 Dr. KB Jama, Neural Dialogue Interface Research
+
+"""
+Safety Monitor Tests - Active alert handling in the safety monitor display.
+"""
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+# The cli.ui package imports every UI module (and their themes) on import, so the
+# safety monitor module is loaded on its own
+_SPEC = importlib.util.spec_from_file_location(
+    'cli.ui.safety_monitor', Path(__file__).parent.parent / 'cli' / 'ui' / 'safety_monitor.py')
+safety_monitor = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(safety_monitor)
+
+# Theme classes SafetyMonitor imports when constructed
+_THEME_CLASSES = {
+    'consciousness_colors': ('ConsciousnessColorScheme',),
+    'sacred_geometry': ('SacredGeometrySymbols', 'ConsciousnessVisualization'),
+    'biofield_aesthetics': ('BiofieldAesthetics',)
+}
+
+class _PlainTheme:
+    """Theme stand-in that renders every style as plain text."""
+    
+    def __getattr__(self, name):
+        return str
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# ACTIVE ALERT TESTS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+@pytest.fixture
+def monitor(monkeypatch):
+    """Safety monitor with two active alerts and plain-text theme helpers."""
+    for module_name, class_names in _THEME_CLASSES.items():
+        module = types.ModuleType(f'cli.themes.{module_name}')
+        for class_name in class_names:
+            setattr(module, class_name, _PlainTheme)
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+    
+    monitor = safety_monitor.SafetyMonitor(terminal_adapter=None)
+    monitor.add_safety_alert('neural_load', safety_monitor.AlertSeverity.WARNING, 'Neural load rising')
+    monitor.add_safety_alert('comfort', 'critical', 'Comfort dropped', ['Pause the session'])
+    return monitor
+
+def test_show_safety_alerts_with_own_active_alerts_keeps_them(monitor, capsys):
+    """Passing the monitor's own active_alerts must not clear them."""
+    active_alerts = monitor.active_alerts
+    
+    monitor.show_safety_alerts(monitor.active_alerts)
+    
+    assert monitor.active_alerts is active_alerts
+    assert [alert.message for alert in monitor.active_alerts] == ['Neural load rising', 'Comfort dropped']
+    output = capsys.readouterr().out
+    assert 'No active safety alerts' not in output
+    assert 'Comfort dropped' in output
+
+def test_show_safety_alerts_replaces_alerts_and_keeps_append_target(monitor, capsys):
+    """Replacement alerts refill the same deque, so later alerts still land in it."""
+    monitor.show_safety_alerts([{'type': 'general', 'severity': 'info', 'message': 'Hydrate'}])
+    monitor.add_safety_alert('comfort', 'warning', 'Posture check')
+    
+    assert [alert.get('message') for alert in monitor.active_alerts] == ['Hydrate', 'Posture check']
+    assert 'Hydrate' in capsys.readouterr().out
+
+def test_safety_alert_get_only_reads_record_fields():
+    """Tuple method names are not alert keys, so get() falls back to the default."""
+    alert = safety_monitor.SafetyAlert('comfort', safety_monitor.AlertSeverity.INFO, 'Breathe', 0.0)
+    
+    assert alert.get('message') == 'Breathe'
+    assert alert.get('count', 0) == 0
+    assert alert.get('index') is None
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# 🧠 Neural Entrainment System v2.0 - Schema Validation Tests
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 🌟 Dr. KB Jama, Neural Dialogue Interface Research
+
+"""
+Schema Validation Tests - Cached jsonschema validators in the main orchestrator.
+"""
+
+import json
+import sys
+import warnings
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+main = pytest.importorskip("main")
+
+# Cross-references use the same #/schema_definitions/... form as configuration_schema.json
+SCHEMA_DOCUMENT = {
+    "schema_definitions": {
+        "layer_schema": {
+            "type": "object",
+            "properties": {"level": {"type": "number", "maximum": 1.0}},
+            "required": ["level"]
+        },
+        "phase_schema": {
+            "type": "object",
+            "properties": {
+                "layers": {"type": "array", "items": {"$ref": "#/schema_definitions/layer_schema"}}
+            }
+        }
+    }
+}
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SCHEMA VALIDATION TESTS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+@pytest.fixture
+def schema_file(tmp_path, monkeypatch):
+    """Schema file with cross-referenced definitions and an empty validator cache."""
+    path = tmp_path / "configuration_schema.json"
+    path.write_text(json.dumps(SCHEMA_DOCUMENT))
+    monkeypatch.setattr(main, "SCHEMA_FILE", path)
+    monkeypatch.setattr(main, "_VALIDATORS", {})
+    monkeypatch.setattr(main, "_VALIDATORS_MTIME", None)
+    return path
+
+def test_validation_resolves_refs_without_deprecation_warnings(schema_file):
+    """A config checked through a $ref is validated against the referenced definition."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        valid = main.validate_config_against_schema({"layers": [{"level": 0.5}]}, "phase_schema")
+        errors = main.validate_config_against_schema({"layers": [{"level": 0.5}, {"level": 1.5}]}, "phase_schema")
+    
+    assert valid == []
+    assert errors == ["Error at $.layers[1].level: 1.5 is greater than the maximum of 1.0"]
+
+def test_validators_are_rebuilt_when_schema_file_changes(schema_file):
+    """Editing the schema file drops the cached validator."""
+    config = {"layers": [{"level": 0.9}]}
+    assert main.validate_config_against_schema(config, "phase_schema") == []
+    
+    document = json.loads(json.dumps(SCHEMA_DOCUMENT))
+    document["schema_definitions"]["layer_schema"]["properties"]["level"]["maximum"] = 0.8
+    schema_file.write_text(json.dumps(document))
+    stat = schema_file.stat()
+    main.os.utime(schema_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    assert main.validate_config_against_schema(config, "phase_schema") == [
+        "Error at $.layers[0].level: 0.9 is greater than the maximum of 0.8"
+    ]
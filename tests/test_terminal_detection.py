@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# 🧠 Neural Entrainment System v2.0 - Terminal Detection Tests
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 🌟 Dr. KB Jama, Neural Dialogue Interface Research
+
+"""
+Terminal Detection Tests - Shared capability profile and terminal size refresh.
+"""
+
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+# Importing the cli package pulls in the full CLI, so the detection module is loaded on its own
+_SPEC = importlib.util.spec_from_file_location(
+    'cli.utils.terminal_detection', Path(__file__).parent.parent / 'cli' / 'utils' / 'terminal_detection.py')
+terminal_detection = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(terminal_detection)
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SHARED CAPABILITY TESTS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+@pytest.fixture
+def terminal_size(monkeypatch):
+    """Controllable terminal size, with no capability profile detected yet."""
+    size = [os.terminal_size((100, 40))]
+    monkeypatch.setattr(terminal_detection.shutil, 'get_terminal_size', lambda *args, **kwargs: size[0])
+    monkeypatch.setattr(terminal_detection.TerminalDetector, '_shared_capabilities', None)
+    return size
+
+def test_detect_terminal_capabilities_follows_resizes(terminal_size):
+    """The shared profile is reused, but its size fields track the current terminal."""
+    caps = terminal_detection.detect_terminal_capabilities()
+    assert (caps.width, caps.height, caps.max_width) == (100, 40, 100)
+    
+    terminal_size[0] = os.terminal_size((150, 30))
+    
+    assert terminal_detection.detect_terminal_capabilities() is caps
+    assert (caps.width, caps.height, caps.max_width, caps.max_height) == (150, 30, 120, 30)
+    settings = terminal_detection.get_optimal_consciousness_settings()
+    assert (settings['max_width'], settings['max_height']) == (120, 30)
+
+def test_forced_redetect_replaces_shared_profile(terminal_size):
+    """Module helpers return the profile from the latest forced re-detection."""
+    first = terminal_detection.detect_terminal_capabilities()
+    
+    redetected = terminal_detection.TerminalDetector().detect_capabilities(force_redetect=True)
+    
+    assert redetected is not first
+    assert terminal_detection.detect_terminal_capabilities() is redetected